@@ -1,90 +1,690 @@
 """API for interacting with Ritual network."""
 
-from typing import Any
+from typing import Any, Dict, List, Tuple, Union
+import asyncio
+import contextlib
+import functools
 import logging
+import threading
+from collections import Counter
 
-from web3 import Web3
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+from web3.exceptions import TimeExhausted, TransactionNotFound
 
 from langchain_ritual_toolkit.configuration import RitualConfig
+from langchain_ritual_toolkit.rate_limit import (
+    RateLimitExceeded,
+    SlidingWindowRateLimiter,
+)
 
 logger = logging.getLogger(__name__)
 
+# Provider options that cache eth_chainId. web3's validation middleware
+# re-fetches the chain id around every eth_estimateGas, even when the
+# transaction already carries chainId; it never changes for an rpc_url.
+_CHAIN_ID_CACHE = {
+    "cache_allowed_requests": True,
+    "cacheable_requests": {"eth_chainId"},
+}
+
+# Arguments the scheduled-transaction fee is computed from
+FEE_KEYS = frozenset({"gasLimit", "gasPrice", "numBlocks", "frequency"})
+
+
+def _scheduled_fee(kwargs: Dict[str, Any]) -> int:
+    """Compute the value to attach to a scheduled transaction."""
+    if missing := FEE_KEYS - kwargs.keys():
+        raise ValueError(f"Missing required fee arguments: {sorted(missing)}")
+
+    # Integer math keeps wei-scale values exact instead of round-tripping
+    # through float.
+    return (
+        kwargs["gasLimit"] * kwargs["gasPrice"] * kwargs["numBlocks"]
+        // kwargs["frequency"]
+    )
+
+
+class _ReceiptWatcher:
+    """Waits for receipts over one shared websocket connection.
+
+    A daemon thread runs an event loop holding a single ``AsyncWeb3``
+    connection and ``newHeads`` subscription; every new block checks the
+    receipts still being waited on. :meth:`wait` blocks the calling thread,
+    so it also works from a thread that is already running an event loop.
+    """
+
+    def __init__(self, rpc_url: str):
+        self.rpc_url = rpc_url
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever, name="ritual-receipts", daemon=True
+        ).start()
+        # Connected lazily on the first wait and again after a disconnect
+        self._w3 = None
+        self._connect_lock = asyncio.Lock()
+        # Pending receipt future -> transaction hash
+        self._waiters: Dict[asyncio.Future, bytes] = {}
+
+    def wait(self, tx_hash, timeout: float):
+        """Block until ``tx_hash`` is mined and return its receipt.
+
+        Raises:
+            TimeExhausted: If no receipt is seen within ``timeout`` seconds
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._wait(tx_hash, timeout), self._loop
+        ).result()
+
+    async def _wait(self, tx_hash, timeout: float):
+        w3 = await self._connect()
+        future = self._loop.create_future()
+        self._waiters[future] = tx_hash
+        try:
+            # The transaction may already be mined before the next block
+            if (receipt := await self._get_receipt(w3, tx_hash)) is not None:
+                return receipt
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {tx_hash.hex()} is not in the chain after "
+                f"{timeout} seconds"
+            )
+        finally:
+            del self._waiters[future]
+
+    async def _connect(self):
+        async with self._connect_lock:
+            if self._w3 is None:
+                # provider.connect() rather than ``await AsyncWeb3(...)``,
+                # which installs signal handlers and so needs the main thread
+                w3 = AsyncWeb3(WebSocketProvider(self.rpc_url))
+                await w3.provider.connect()
+                await w3.eth.subscribe("newHeads")
+                self._w3 = w3
+                self._loop.create_task(self._watch(w3))
+            return self._w3
+
+    @staticmethod
+    async def _get_receipt(w3, tx_hash):
+        try:
+            return await w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    async def _watch(self, w3):
+        try:
+            async for _ in w3.socket.process_subscriptions():
+                waiters = [
+                    (future, tx_hash)
+                    for future, tx_hash in self._waiters.items()
+                    if not future.done()
+                ]
+                receipts = await asyncio.gather(
+                    *(self._get_receipt(w3, tx_hash) for _, tx_hash in waiters)
+                )
+                for (future, _), receipt in zip(waiters, receipts):
+                    if receipt is not None and not future.done():
+                        future.set_result(receipt)
+            error = ConnectionError("Websocket subscription closed")
+        except Exception as exc:
+            error = exc
+
+        # Fail whoever is still waiting; the next wait() reconnects
+        self._w3 = None
+        for future in self._waiters:
+            if not future.done():
+                future.set_exception(error)
+        with contextlib.suppress(Exception):
+            await w3.provider.disconnect()
+
 
 class RitualAPI:
-    def __init__(self, private_key: str, rpc_url: str, ritual_config: RitualConfig):
+    def __init__(
+        self,
+        private_key: str,
+        rpc_url: str,
+        ritual_config: RitualConfig,
+        poll_latency: float = 2.0,
+        timeout: float = 120,
+        max_calls: int = 10,
+        window: float = 10.0,
+        batch_size: int = 20,
+    ):
         super().__init__()
         self.private_key = private_key
         self.rpc_url = rpc_url
         self.ritual_config = ritual_config
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        # Receipt polling settings; blocks land every ~12s so polling faster
+        # than a couple of seconds only adds RPC load.
+        self.poll_latency = poll_latency
+        self.timeout = timeout
+        # Max transactions per JSON-RPC batch POST in run_batch(); many
+        # providers cap batch length, so larger batches are split.
+        self.batch_size = batch_size
+        # ws:// endpoints wait for receipts on new-block notifications instead
+        # of polling; everything else goes over HTTP.
+        self.use_websocket = rpc_url.startswith(("ws://", "wss://"))
+        if self.use_websocket:
+            self.session = None
+            self.web3 = Web3(Web3.LegacyWebSocketProvider(rpc_url, **_CHAIN_ID_CACHE))
+            self._receipts = _ReceiptWatcher(rpc_url)
+        else:
+            # Keep one pooled keep-alive session for the API's lifetime so sends
+            # and receipt polls reuse the same TCP/TLS connections.
+            self.session = self._create_session()
+            self.web3 = Web3(
+                Web3.HTTPProvider(
+                    rpc_url,
+                    session=self.session,
+                    request_kwargs={"timeout": 30},
+                    **_CHAIN_ID_CACHE,
+                )
+            )
         self.account = self.web3.eth.account.from_key(self.private_key)
+        # Account.address re-derives the checksum address on every access
+        self._from_address = self.account.address
+
+        # Parse the ABI once and resolve the schedule/cancel functions up front
+        # so the send paths don't rebuild the contract or walk the ABI per call.
+        # get_function_by_name also fails fast on a missing or ambiguous name.
+        self._contract = self.web3.eth.contract(
+            address=ritual_config.contract_address,
+            abi=ritual_config.raw_abi,
+        )
+        self._schedule_builder = self._contract.get_function_by_name(
+            ritual_config.schedule_fn
+        )
+        self._cancel_builder = self._contract.get_function_by_name(
+            ritual_config.cancel_fn
+        )
+
+        # Method name -> (result label, sender) for run()
+        self._dispatch = {
+            "schedule_transaction": ("Schedule", self._send_scheduled_transaction),
+            "cancel_scheduled_transaction": (
+                "Cancel",
+                self._send_cancel_scheduled_transaction,
+            ),
+        }
+
+        # Method name -> (contract function, value calculator) for run_batch()
+        self._batch_builders = {
+            "schedule_transaction": (self._schedule_builder, _scheduled_fee),
+            "cancel_scheduled_transaction": (self._cancel_builder, None),
+        }
+
+        # Separate buckets so a runaway schedule loop can't starve cancels
+        self._limiters = {
+            method: SlidingWindowRateLimiter(max_calls, window)
+            for method in self._dispatch
+        }
+
+        # Chain id never changes for a given rpc_url; fetched lazily with the
+        # first nonce lookup and reused afterwards.
+        self._chain_id = None
+        # Fields shared by every transaction; chainId is added once known.
+        self._tx_template = {"from": self._from_address}
+        # Serializes nonce lookup through send so concurrent arun() calls
+        # can't reuse a pending nonce; receipt waits still overlap.
+        self._send_lock = threading.Lock()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    def _get_nonce(self) -> int:
+        """Fetch the pending nonce for the account.
+
+        On first use the chain id lookup rides along in the same JSON-RPC
+        batch, so both values cost a single HTTP round-trip.
+        """
+        address = self._from_address
+        if self._chain_id is not None:
+            return self.web3.eth.get_transaction_count(address, "pending")
+
+        with self.web3.batch_requests() as batch:
+            batch.add(self.web3.eth.get_transaction_count(address, "pending"))
+            batch.add(self.web3.eth._chain_id())
+            nonce, chain_id = batch.execute()
+        self._chain_id = chain_id
+        self._tx_template["chainId"] = chain_id
+        return nonce
+
+    def _wait_for_receipt(self, tx_hash):
+        if self.use_websocket:
+            return self._receipts.wait(tx_hash, self.timeout)
+        return self.web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=self.timeout, poll_latency=self.poll_latency
+        )
 
     def _send_transaction(self, transaction):
-        logger.info(f"Sending transaction: {transaction}")
+        logger.info("Sending transaction: %s", transaction)
         signed_txn = self.web3.eth.account.sign_transaction(
             transaction, self.private_key
         )
         return self.web3.eth.send_raw_transaction(signed_txn.raw_transaction)
 
     def _send_scheduled_transaction(self, **kwargs):
-        logger.info(f"Scheduling transaction with kwargs: {kwargs}")
-        contract = self.web3.eth.contract(
-            address=self.ritual_config.contract_address,
-            abi=self.ritual_config.raw_abi,
-        )
-        # Get the function from the contract using the schedule_fn name
-        contract_function = getattr(contract.functions, self.ritual_config.schedule_fn)
-        
+        logger.info("Scheduling transaction with kwargs: %s", kwargs)
+
         # Calculate the fee based on gas parameters
-        fee = int(
-            kwargs["gasLimit"]
-            * (kwargs["gasPrice"] * (kwargs["numBlocks"] / kwargs["frequency"]))
-        )
-        
+        fee = _scheduled_fee(kwargs)
+
         # Build the transaction with the provided kwargs and fee as value
-        transaction = contract_function(**kwargs).build_transaction(
-            {
-                "from": self.account.address,
-                "nonce": self.web3.eth.get_transaction_count(self.account.address),
-                "value": fee,
-            }
-        )
-        tx_hash = self._send_transaction(transaction)
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        assert receipt.status == 1
+        with self._send_lock:
+            nonce = self._get_nonce()
+            tx_params = self._tx_template.copy()
+            tx_params["nonce"] = nonce
+            tx_params["value"] = fee
+            transaction = self._schedule_builder(**kwargs).build_transaction(
+                tx_params
+            )
+            tx_hash = self._send_transaction(transaction)
+        receipt = self._wait_for_receipt(tx_hash)
+        # Explicit check: an assert would be stripped under python -O
+        if receipt["status"] != 1:
+            raise RuntimeError(f"Transaction failed: 0x{tx_hash.hex()}")
         return tx_hash
 
     def _send_cancel_scheduled_transaction(self, **kwargs):
-        logger.info(f"Canceling transaction with kwargs: {kwargs}")
-        contract = self.web3.eth.contract(
-            address=self.ritual_config.contract_address,
-            abi=self.ritual_config.raw_abi,
+        logger.info("Canceling transaction with kwargs: %s", kwargs)
+
+        with self._send_lock:
+            # Build the transaction with the provided kwargs
+            nonce = self._get_nonce()
+            tx_params = self._tx_template.copy()
+            tx_params["nonce"] = nonce
+            transaction = self._cancel_builder(**kwargs).build_transaction(tx_params)
+
+            # Send the transaction using the existing _send_transaction method
+            tx_hash = self._send_transaction(transaction)
+        receipt = self._wait_for_receipt(tx_hash)
+        # Explicit check: an assert would be stripped under python -O
+        if receipt["status"] != 1:
+            raise RuntimeError(f"Transaction failed: 0x{tx_hash.hex()}")
+        return tx_hash
+
+    def run(self, method: str, *args: Any, **kwargs: Any) -> str:
+        try:
+            label, send = self._dispatch[method]
+        except KeyError:
+            raise ValueError(f"Unknown method: {method}")
+        self._limiters[method].check()
+        tx_hash = send(**kwargs)
+        return f"{label} transaction successful. Transaction hash: 0x{tx_hash.hex()}"
+
+    async def arun(self, method: str, *args: Any, **kwargs: Any) -> str:
+        """Async :meth:`run`, executed on the default thread pool.
+
+        Lets an async agent overlap receipt waits for several tool calls;
+        sends stay ordered through ``_send_lock``.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.run, method, *args, **kwargs)
         )
 
-        # Get the function from the contract using the cancel_fn name
-        contract_function = getattr(contract.functions, self.ritual_config.cancel_fn)
+    def run_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]], batch_size: int = None
+    ) -> List[Union[str, Exception]]:
+        """Run several operations, sending them as JSON-RPC batches.
+
+        Transactions are signed locally with consecutive nonces and every
+        ``batch_size`` of them go out in a single ``eth_sendRawTransaction``
+        batch POST. Websocket endpoints fall back to one :meth:`run` per call.
+
+        Chunks are capped at the rate limit and each chunk's quota is
+        reserved before anything is signed, so a chunk over the limit sends
+        nothing and uses no quota. If the node rejects a transaction while
+        later ones are accepted, a 0-value self-transfer fills its nonce so
+        the later transactions can still be mined.
+
+        Args:
+            calls: ``(method, kwargs)`` pairs, as accepted by :meth:`run`
+            batch_size: Max transactions per POST; defaults to ``self.batch_size``
 
-        # Build the transaction with the provided kwargs
-        transaction = contract_function(**kwargs).build_transaction(
-            {
-                "from": self.account.address,
-                "nonce": self.web3.eth.get_transaction_count(self.account.address),
-            }
+        Returns:
+            List[Union[str, Exception]]: Result message, or the exception
+                that call failed with (rate limit, rejection, revert, ...),
+                in the same order as ``calls``
+
+        Raises:
+            ValueError: If a method is unknown; raised before anything is sent
+        """
+        for method, _ in calls:
+            if method not in self._dispatch:
+                raise ValueError(f"Unknown method: {method}")
+
+        if self.use_websocket:
+            results = []
+            for method, kwargs in calls:
+                try:
+                    results.append(self.run(method, **kwargs))
+                except Exception as exc:
+                    results.append(exc)
+            return results
+
+        # A chunk larger than the quota could never be reserved
+        max_calls = min(limiter.max_calls for limiter in self._limiters.values())
+        batch_size = min(batch_size or self.batch_size, max_calls)
+        results = []
+        for start in range(0, len(calls), batch_size):
+            results.extend(self._run_batch_chunk(calls[start:start + batch_size]))
+        return results
+
+    def _reserve(self, calls: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Reserve rate-limit quota for every call, or for none of them."""
+        reserved = []
+        try:
+            for method, count in Counter(method for method, _ in calls).items():
+                self._limiters[method].check(count)
+                reserved.append((method, count))
+        except RateLimitExceeded:
+            for method, count in reserved:
+                self._limiters[method].release(count)
+            raise
+
+    def _run_batch_chunk(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Union[str, Exception]]:
+        try:
+            self._reserve(calls)
+        except RateLimitExceeded as exc:
+            return [exc] * len(calls)
+
+        results: List[Union[str, Exception, None]] = [None] * len(calls)
+        # Index of a rejected transaction whose nonce couldn't be filled;
+        # accepted transactions after it can't be mined.
+        stuck_at = None
+        with self._send_lock:
+            try:
+                nonce, replies = self._send_batch(calls)
+            except Exception as exc:
+                return [exc] * len(calls)
+            last_accepted = max(
+                (i for i, reply in enumerate(replies) if "error" not in reply),
+                default=-1,
+            )
+            for i, reply in enumerate(replies):
+                if "error" not in reply:
+                    continue
+                results[i] = RuntimeError(
+                    f"Transaction rejected: {reply['error']}"
+                )
+                if i < last_accepted and stuck_at is None:
+                    try:
+                        self._fill_nonce(nonce + i)
+                    except Exception:
+                        logger.exception("Failed to fill nonce %d", nonce + i)
+                        stuck_at = i
+
+        for i, ((method, _), reply) in enumerate(zip(calls, replies)):
+            if results[i] is not None:
+                continue
+            tx_hash = bytes.fromhex(reply["result"].removeprefix("0x"))
+            if stuck_at is not None and i > stuck_at:
+                results[i] = RuntimeError(
+                    f"Transaction 0x{tx_hash.hex()} is stuck behind unused "
+                    f"nonce {nonce + stuck_at}"
+                )
+                continue
+            try:
+                receipt = self._wait_for_receipt(tx_hash)
+            except Exception as exc:
+                results[i] = exc
+                continue
+            if receipt["status"] != 1:
+                results[i] = RuntimeError(f"Transaction failed: 0x{tx_hash.hex()}")
+                continue
+            label = self._dispatch[method][0]
+            results[i] = (
+                f"{label} transaction successful. Transaction hash: 0x{tx_hash.hex()}"
+            )
+        return results
+
+    def _send_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> Tuple[int, List[Dict]]:
+        """Sign ``calls`` with consecutive nonces and POST them as one batch.
+
+        Returns:
+            Tuple[int, List[Dict]]: The first nonce used, and the JSON-RPC
+                replies in ``calls`` order
+        """
+        nonce = self._get_nonce()
+        payload = []
+        for i, (method, kwargs) in enumerate(calls):
+            builder, fee = self._batch_builders[method]
+            tx_params = self._tx_template.copy()
+            tx_params["nonce"] = nonce + i
+            if fee is not None:
+                tx_params["value"] = fee(kwargs)
+            transaction = builder(**kwargs).build_transaction(tx_params)
+            logger.info("Sending transaction: %s", transaction)
+            signed_txn = self.web3.eth.account.sign_transaction(
+                transaction, self.private_key
+            )
+            payload.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "eth_sendRawTransaction",
+                    "params": [Web3.to_hex(signed_txn.raw_transaction)],
+                }
+            )
+
+        response = self.session.post(self.rpc_url, json=payload, timeout=30)
+        response.raise_for_status()
+        # JSON-RPC 2.0 doesn't guarantee response order
+        return nonce, sorted(response.json(), key=lambda reply: reply["id"])
+
+    def _fill_nonce(self, nonce: int):
+        """Send a 0-value self-transfer at ``nonce`` to close a nonce gap."""
+        transaction = self._tx_template.copy()
+        transaction.update(
+            to=self._from_address,
+            value=0,
+            gas=21000,
+            gasPrice=self.web3.eth.gas_price,
+            nonce=nonce,
+        )
+        return self._send_transaction(transaction)
+
+
+class AsyncRitualAPI:
+    """Async counterpart of RitualAPI for scheduling many jobs at once.
+
+    Uses AsyncWeb3 so signing, sending and receipt waits for several jobs
+    overlap instead of running one after another. Nonces are tracked
+    locally after a single ``pending`` fetch so concurrent sends don't each
+    round-trip for one.
+
+    ``run`` is a coroutine here, so this is not a ``RitualAPILike`` and
+    can't back a RitualTool; await :meth:`run` or :meth:`run_many` directly.
+    """
+
+    def __init__(
+        self,
+        private_key: str,
+        rpc_url: str,
+        ritual_config: RitualConfig,
+        poll_latency: float = 2.0,
+        timeout: float = 120,
+        max_calls: int = 10,
+        window: float = 10.0,
+    ):
+        self.private_key = private_key
+        self.rpc_url = rpc_url
+        self.ritual_config = ritual_config
+        self.poll_latency = poll_latency
+        self.timeout = timeout
+        self.web3 = AsyncWeb3(
+            AsyncWeb3.AsyncHTTPProvider(
+                rpc_url, request_kwargs={"timeout": 30}, **_CHAIN_ID_CACHE
+            )
+        )
+        self.account = self.web3.eth.account.from_key(self.private_key)
+        self._from_address = self.account.address
+
+        self._contract = self.web3.eth.contract(
+            address=ritual_config.contract_address,
+            abi=ritual_config.raw_abi,
         )
+        self._schedule_builder = self._contract.get_function_by_name(
+            ritual_config.schedule_fn
+        )
+        self._cancel_builder = self._contract.get_function_by_name(
+            ritual_config.cancel_fn
+        )
+
+        self._dispatch = {
+            "schedule_transaction": ("Schedule", self._send_scheduled_transaction),
+            "cancel_scheduled_transaction": (
+                "Cancel",
+                self._send_cancel_scheduled_transaction,
+            ),
+        }
+        self._limiters = {
+            method: SlidingWindowRateLimiter(max_calls, window)
+            for method in self._dispatch
+        }
+
+        self._tx_template = {"from": self._from_address}
+        # Next nonce to hand out; None until seeded from the node
+        self._nonce = None
+        # Nonces handed out whose transactions haven't reached the node yet
+        self._in_flight: set = set()
+        self._nonce_lock = asyncio.Lock()
+
+    async def _next_nonce(self) -> int:
+        """Reserve the next nonce, seeding it (and chainId) on first use."""
+        async with self._nonce_lock:
+            if self._nonce is None:
+                async with self.web3.batch_requests() as batch:
+                    batch.add(
+                        self.web3.eth.get_transaction_count(
+                            self._from_address, "pending"
+                        )
+                    )
+                    batch.add(self.web3.eth._chain_id())
+                    nonce, chain_id = await batch.async_execute()
+                self._nonce = nonce
+                self._tx_template["chainId"] = chain_id
+            nonce = self._nonce
+            self._nonce += 1
+            self._in_flight.add(nonce)
+            return nonce
+
+    async def _release_failed_nonce(self, nonce: int) -> None:
+        """Give back a nonce whose transaction never reached the node.
+
+        If it was the newest nonce handed out and no other send is in
+        flight, the counter is re-seeded from the node's ``pending`` count
+        on the next send. Otherwise other sends hold nonces the node hasn't
+        seen (or that sit behind this gap), so re-seeding could hand one out
+        twice; a 0-value self-transfer fills this nonce instead.
+        """
+        async with self._nonce_lock:
+            self._in_flight.discard(nonce)
+            if not self._in_flight and self._nonce == nonce + 1:
+                self._nonce = None
+                return
+        try:
+            await self._fill_nonce(nonce)
+        except Exception:
+            logger.exception("Failed to fill nonce %d", nonce)
+
+    async def _fill_nonce(self, nonce: int):
+        """Send a 0-value self-transfer at ``nonce`` to close a nonce gap."""
+        transaction = self._tx_template.copy()
+        transaction.update(
+            to=self._from_address,
+            value=0,
+            gas=21000,
+            gasPrice=await self.web3.eth.gas_price,
+            nonce=nonce,
+        )
+        signed_txn = self.web3.eth.account.sign_transaction(
+            transaction, self.private_key
+        )
+        return await self.web3.eth.send_raw_transaction(signed_txn.raw_transaction)
 
-        # Send the transaction using the existing _send_transaction method
-        tx_hash = self._send_transaction(transaction)
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        assert receipt.status == 1
+    async def _send(self, contract_call, value: int = 0):
+        tx_params = self._tx_template.copy()
+        nonce = await self._next_nonce()
+        tx_params["nonce"] = nonce
+        if value:
+            tx_params["value"] = value
+        try:
+            transaction = await contract_call.build_transaction(tx_params)
+            logger.info("Sending transaction: %s", transaction)
+            signed_txn = self.web3.eth.account.sign_transaction(
+                transaction, self.private_key
+            )
+            tx_hash = await self.web3.eth.send_raw_transaction(
+                signed_txn.raw_transaction
+            )
+        except Exception:
+            await self._release_failed_nonce(nonce)
+            raise
+        self._in_flight.discard(nonce)
+
+        receipt = await self.web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=self.timeout, poll_latency=self.poll_latency
+        )
+        if receipt["status"] != 1:
+            raise RuntimeError(f"Transaction failed: 0x{tx_hash.hex()}")
         return tx_hash
 
-    def run(self, method: str, *args: Any, **kwargs: Any) -> str:
-        if method == "schedule_transaction":
-            tx_hash = self._send_scheduled_transaction(**kwargs)
-            return f"Schedule transaction successful. Transaction hash: 0x{tx_hash.hex()}"
+    async def _send_scheduled_transaction(self, **kwargs):
+        logger.info("Scheduling transaction with kwargs: %s", kwargs)
+        fee = _scheduled_fee(kwargs)
+        return await self._send(self._schedule_builder(**kwargs), value=fee)
 
-        elif method == "cancel_scheduled_transaction":
-            tx_hash = self._send_cancel_scheduled_transaction(**kwargs)
-            return f"Cancel transaction successful. Transaction hash: 0x{tx_hash.hex()}"
-        else:
+    async def _send_cancel_scheduled_transaction(self, **kwargs):
+        logger.info("Canceling transaction with kwargs: %s", kwargs)
+        return await self._send(self._cancel_builder(**kwargs))
+
+    async def run(self, method: str, *args: Any, **kwargs: Any) -> str:
+        try:
+            label, send = self._dispatch[method]
+        except KeyError:
             raise ValueError(f"Unknown method: {method}")
+        self._limiters[method].check()
+        tx_hash = await send(**kwargs)
+        return f"{label} transaction successful. Transaction hash: 0x{tx_hash.hex()}"
+
+    # Already a coroutine; same name as RitualAPI.arun for shared callers
+    arun = run
+
+    async def run_many(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Union[str, Exception]]:
+        """Run several operations concurrently.
+
+        A failed call doesn't abandon the others: sends already in flight
+        (e.g. when the rate limiter rejects calls past its quota) still
+        complete and their transaction hashes are returned.
+
+        Args:
+            calls: ``(method, kwargs)`` pairs, as accepted by :meth:`run`
+
+        Returns:
+            List[Union[str, Exception]]: Result message, or the exception
+                raised, for each call in the same order as ``calls``
+        """
+        return await asyncio.gather(
+            *(self.run(method, **kwargs) for method, kwargs in calls),
+            return_exceptions=True,
+        )
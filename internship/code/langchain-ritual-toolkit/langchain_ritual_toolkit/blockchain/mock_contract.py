@@ -1,6 +1,5 @@
 """Mock staking contract implementation."""
 
-from decimal import Decimal
 from typing import Dict, Optional, Any
 
 from .mock_state import MockBlockchainState
@@ -12,8 +11,15 @@ class MockStakingContract:
         """Initialize mock staking contract."""
         self.blockchain = blockchain
         
-    def stake(self, address: str, amount: Decimal, validator: Optional[str] = None) -> Dict[str, Any]:
-        """Stake tokens."""
+    def stake(self, address: str, amount: int, validator: Optional[str] = None) -> Dict[str, Any]:
+        """Stake tokens.
+        
+        Args:
+            address: Staker address
+            amount: Amount in wei; coerced to int once on entry
+            validator: Validator to stake with (optional)
+        """
+        amount = int(amount)
         current_balance = self.blockchain.get_balance(address)
         if current_balance < amount:
             raise ValueError(f"Insufficient balance: {current_balance} < {amount}")
@@ -1,38 +1,39 @@
 """Mock blockchain state implementation."""
 
-from decimal import Decimal
 from typing import Dict, Optional
 
 class MockBlockchainState:
-    """Mock blockchain state for testing."""
+    """Mock blockchain state for testing.
+    
+    Amounts are tracked as integer wei.
+    """
     
     def __init__(self):
         """Initialize mock blockchain state."""
-        self.balances: Dict[str, Decimal] = {}
-        self.stakes: Dict[str, Dict[str, Decimal]] = {}
+        self.balances: Dict[str, int] = {}
+        self.stakes: Dict[str, Dict[str, int]] = {}
+        # Running per-address total across validators, kept in sync by set_stake
+        self.stake_totals: Dict[str, int] = {}
         
-    def get_balance(self, address: str) -> Decimal:
+    def get_balance(self, address: str) -> int:
         """Get balance for an address."""
-        return self.balances.get(address, Decimal('0'))
+        return self.balances.get(address, 0)
         
-    def set_balance(self, address: str, amount: Decimal):
+    def set_balance(self, address: str, amount: int):
         """Set balance for an address."""
         self.balances[address] = amount
         
-    def get_stake(self, address: str, validator: Optional[str] = None) -> Decimal:
+    def get_stake(self, address: str, validator: Optional[str] = None) -> int:
         """Get stake amount for an address."""
-        if address not in self.stakes:
-            return Decimal('0')
         if validator:
-            return self.stakes[address].get(validator, Decimal('0'))
-        return sum(self.stakes[address].values())
+            return self.stakes.get(address, {}).get(validator, 0)
+        return self.stake_totals.get(address, 0)
         
-    def set_stake(self, address: str, amount: Decimal, validator: Optional[str] = None):
+    def set_stake(self, address: str, amount: int, validator: Optional[str] = None):
         """Set stake amount for an address."""
-        if address not in self.stakes:
-            self.stakes[address] = {}
-        if validator:
-            self.stakes[address][validator] = amount
-        else:
-            # Use default validator
-            self.stakes[address]['default'] = amount
+        stakes = self.stakes.setdefault(address, {})
+        # Use default validator if none given
+        key = validator or 'default'
+        old = stakes.get(key, 0)
+        stakes[key] = amount
+        self.stake_totals[address] = self.stake_totals.get(address, 0) + (amount - old)
@@ -4,28 +4,52 @@ This module provides functionality for loading and managing Ritual network
 configuration, including contract addresses and ABIs.
 """
 
+import functools
 import json
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
+# Bundled examples directory, searched for a config after the cwd
+PKG_EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
 
-class ABIInput(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class ABIInput:
     """ABI input parameter.
     
     Attributes:
         name: Parameter name
         type: Parameter type
         internal_type: Internal type (optional)
+        components: Struct members for tuple types (optional)
     """
     name: str
     type: str
-    internal_type: Optional[str] = Field(None, alias="internalType")
+    internal_type: Optional[str] = None
+    components: Optional[List["ABIInput"]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ABIInput":
+        """Build from a raw ABI entry, mapping ``internalType``."""
+        components = data.get("components")
+        return cls(
+            name=data["name"],
+            type=data["type"],
+            internal_type=data.get("internalType"),
+            components=(
+                None if components is None
+                else [ABIInput.from_dict(c) for c in components]
+            ),
+        )
 
 
-class ABIOutput(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ABIOutput:
     """ABI output parameter.
     
     Attributes:
@@ -35,12 +59,25 @@ class ABIOutput(BaseModel):
     """
     name: str
     type: str
-    internal_type: Optional[str] = Field(None, alias="internalType")
+    internal_type: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ABIOutput":
+        """Build from a raw ABI entry, mapping ``internalType``."""
+        return cls(
+            name=data["name"],
+            type=data["type"],
+            internal_type=data.get("internalType"),
+        )
 
-class ABIItem(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class ABIItem:
     """ABI item.
     
+    The ABI comes from static, already well-formed JSON, so these are plain
+    dataclasses rather than validated pydantic models.
+    
     Attributes:
         type: Item type (function, event, etc.)
         name: Item name (optional)
@@ -54,6 +91,19 @@ class ABIItem(BaseModel):
     outputs: Optional[List[ABIOutput]] = None
     stateMutability: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ABIItem":
+        """Build from a raw ABI entry, ignoring keys we don't model."""
+        inputs = data.get("inputs")
+        outputs = data.get("outputs")
+        return cls(
+            type=data["type"],
+            name=data.get("name"),
+            inputs=None if inputs is None else [ABIInput.from_dict(i) for i in inputs],
+            outputs=None if outputs is None else [ABIOutput.from_dict(o) for o in outputs],
+            stateMutability=data.get("stateMutability"),
+        )
+
 
 class RitualConfig(BaseModel):
     """Configuration for Ritual network.
@@ -69,16 +119,44 @@ class RitualConfig(BaseModel):
     schedule_fn: str
     cancel_fn: str
     
-    @property
+    @functools.cached_property
     def abi(self) -> List[ABIItem]:
         """Get the contract ABI.
         
         For backward compatibility with code that expects the abi attribute.
+        Parsed once per config instance and cached.
         
         Returns:
             List[ABIItem]: Contract ABI
         """
-        return [ABIItem(**item) for item in self.raw_abi]
+        return [ABIItem.from_dict(item) for item in self.raw_abi]
+
+    @functools.cached_property
+    def abi_names(self) -> Tuple[Optional[str], ...]:
+        """Get the name of each ABI item, parallel to ``abi``.
+        
+        Read straight from ``raw_abi``, so it doesn't force parsing.
+        
+        Returns:
+            Tuple[Optional[str], ...]: Item names, None for unnamed items
+        """
+        return tuple(item.get("name") for item in self.raw_abi)
+
+    @functools.cached_property
+    def abi_index(self) -> Dict[str, int]:
+        """Get the position in ``abi`` of each named item.
+        
+        Overloaded names map to their first occurrence, matching a linear
+        search over ``abi``.
+        
+        Returns:
+            Dict[str, int]: Indexes into ``abi`` by name
+        """
+        index: Dict[str, int] = {}
+        for i, name in enumerate(self.abi_names):
+            if name is not None:
+                index.setdefault(name, i)
+        return index
 
 
 def find_config_file(name: str = "ritual_config.json") -> Optional[Path]:
@@ -90,25 +168,84 @@ def find_config_file(name: str = "ritual_config.json") -> Optional[Path]:
     Returns:
         Path to config file if found, None otherwise
     """
-    # Check current directory first
-    if (current_dir := Path.cwd() / name).exists():
-        return current_dir
-        
-    # Check package examples directory
-    if (pkg_dir := Path(__file__).parent.parent / "examples" / name).exists():
-        return pkg_dir
-        
-    # Check environment variable
-    if config_path := os.getenv("RITUAL_CONFIG_PATH"):
-        if (env_path := Path(config_path)).exists():
-            return env_path
+    # The lookup only depends on these inputs, so the cached search below
+    # stays correct if the working directory or env var changes.
+    return _find_config_file(name, Path.cwd(), os.getenv("RITUAL_CONFIG_PATH"))
+
+
+@functools.lru_cache(maxsize=4)
+def _find_config_file(
+    name: str, cwd: Path, env_config_path: Optional[str]
+) -> Optional[Path]:
+    # Candidates in priority order: current directory, package examples
+    # directory, then the RITUAL_CONFIG_PATH environment variable
+    candidates = [cwd / name, PKG_EXAMPLES_DIR / name]
+    if env_config_path:
+        candidates.append(Path(env_config_path))
+
+    for candidate in candidates:
+        try:
+            os.stat(candidate)
+        except OSError:
+            continue
+        return candidate
             
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _load_from_path(path: Path, mtime_ns: int) -> RitualConfig:
+    """Load and parse a config file.
+    
+    The file's modification time is part of the cache key, so an edited
+    config is re-read while unchanged files are parsed only once.
+    """
+    with open(path) as f:
+        return _config_from_dict(json.load(f))
+
+
+# ABI keys whose values repeat across entries ("uint256", "view", ...)
+_INTERNED_ABI_KEYS = frozenset({"type", "internalType", "name", "stateMutability"})
+
+
+def _intern_abi_strings(obj) -> None:
+    """Intern repeated ABI strings in place so equal values share one object."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, str):
+                if key in _INTERNED_ABI_KEYS:
+                    obj[key] = sys.intern(value)
+            else:
+                _intern_abi_strings(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            _intern_abi_strings(item)
+
+
+def _config_from_dict(config: dict) -> RitualConfig:
+    # Validate config
+    if not isinstance(config, dict):
+        raise ValueError("Config must be a dictionary")
+        
+    required_fields = {"contract_address", "abi", "schedule_fn", "cancel_fn"}
+    if missing := required_fields - set(config.keys()):
+        raise ValueError(f"Missing required fields in config: {missing}")
+
+    _intern_abi_strings(config["abi"])
+    return RitualConfig(
+        contract_address=config["contract_address"],
+        raw_abi=config["abi"],
+        schedule_fn=config["schedule_fn"],
+        cancel_fn=config["cancel_fn"]
+    )
+
+
 def load_ritual_config(config: Optional[Union[str, dict, Path]] = None) -> RitualConfig:
     """Load Ritual network configuration.
     
+    Configs loaded from a file are cached per path, so repeated toolkit
+    construction does not re-read or re-validate an unchanged file.
+    
     Args:
         config: Path to config file, config dict, or None to use default
         
@@ -138,25 +275,12 @@ def load_ritual_config(config: Optional[Union[str, dict, Path]] = None) -> Ritua
             # If path is relative, make it absolute from current working directory
             config_path = Path.cwd() / config_path
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            config_path = config_path.resolve()
+            return _load_from_path(config_path, config_path.stat().st_mtime_ns)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Config file not found: {config_path}. "
                 "Please provide a valid path to ritual_config.json"
             )
             
-    # Validate config
-    if not isinstance(config, dict):
-        raise ValueError("Config must be a dictionary")
-        
-    required_fields = {"contract_address", "abi", "schedule_fn", "cancel_fn"}
-    if missing := required_fields - set(config.keys()):
-        raise ValueError(f"Missing required fields in config: {missing}")
-        
-    return RitualConfig(
-        contract_address=config["contract_address"],
-        raw_abi=config["abi"],
-        schedule_fn=config["schedule_fn"],
-        cancel_fn=config["cancel_fn"]
-    )
+    return _config_from_dict(config)
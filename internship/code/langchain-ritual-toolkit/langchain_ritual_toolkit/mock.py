@@ -1,492 +1,43 @@
 """Mock API for testing without blockchain."""
 
-import uuid
+import asyncio
+import functools
+import json
+from pathlib import Path
+from secrets import token_hex
 from typing import Any
 
+from langchain_ritual_toolkit.configuration import RitualConfig, load_ritual_config
+
+
+# Bundled mock contract config (address, ABI, function names)
+MOCK_CONFIG_PATH = Path(__file__).resolve().parent / "mock_abi.json"
+
+
+@functools.cache
+def _load_mock_config() -> dict:
+    with open(MOCK_CONFIG_PATH) as f:
+        return json.load(f)
+
+
+def __getattr__(name: str) -> Any:
+    # MockConfig is read from disk on first access, so importing this module
+    # in non-mock runs doesn't pay for the ABI.
+    if name == "MockConfig":
+        return _load_mock_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Mock config
-MockConfig: dict = {
-    "contract_address": "0xa53C1aEf5a19d82037Fe7E54A3CBAa852f808E21",
-    "abi": [
-        {
-            "type": "constructor",
-            "inputs": [
-                {
-                    "name": "_scheduler",
-                    "type": "address",
-                    "internalType": "contract Scheduler"
-                }
-            ],
-            "stateMutability": "nonpayable"
-        },
-        {
-            "type": "fallback",
-            "stateMutability": "payable"
-        },
-        {
-            "type": "receive",
-            "stateMutability": "payable"
-        },
-        {
-            "type": "function",
-            "name": "NETWORK_REQUEST",
-            "inputs": [],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "address",
-                    "internalType": "address"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "REGISTER_SECRET",
-            "inputs": [],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "address",
-                    "internalType": "address"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "cancelCallback",
-            "inputs": [
-                {
-                    "name": "id",
-                    "type": "uint256",
-                    "internalType": "uint256"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "nonpayable"
-        },
-        {
-            "type": "function",
-            "name": "cancelJob",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "nonpayable"
-        },
-        {
-            "type": "function",
-            "name": "genericComputeCallback",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                },
-                {
-                    "name": "target",
-                    "type": "address",
-                    "internalType": "address"
-                },
-                {
-                    "name": "inputs",
-                    "type": "bytes",
-                    "internalType": "bytes"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "nonpayable"
-        },
-        {
-            "type": "function",
-            "name": "getComputeOutputs",
-            "inputs": [],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "string[]",
-                    "internalType": "string[]"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "getJobOutput",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                }
-            ],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "bytes[]",
-                    "internalType": "bytes[]"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "getScheduledJobs",
-            "inputs": [],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "string[]",
-                    "internalType": "string[]"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "jobIdToCallId",
-            "inputs": [
-                {
-                    "name": "",
-                    "type": "string",
-                    "internalType": "string"
-                }
-            ],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "uint256",
-                    "internalType": "uint256"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "jobIds",
-            "inputs": [
-                {
-                    "name": "",
-                    "type": "uint256",
-                    "internalType": "uint256"
-                }
-            ],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "string",
-                    "internalType": "string"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "normalComputeCallback",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "nonpayable"
-        },
-        {
-            "type": "function",
-            "name": "receivedBlocks",
-            "inputs": [
-                {
-                    "name": "",
-                    "type": "string",
-                    "internalType": "string"
-                },
-                {
-                    "name": "",
-                    "type": "uint256",
-                    "internalType": "uint256"
-                }
-            ],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "uint256",
-                    "internalType": "uint256"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "receivedOutputs",
-            "inputs": [
-                {
-                    "name": "",
-                    "type": "string",
-                    "internalType": "string"
-                },
-                {
-                    "name": "",
-                    "type": "uint256",
-                    "internalType": "uint256"
-                }
-            ],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "bytes",
-                    "internalType": "bytes"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "function",
-            "name": "scheduleCompute",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                },
-                {
-                    "name": "sidecarId",
-                    "type": "uint8",
-                    "internalType": "uint8"
-                },
-                {
-                    "name": "inputs",
-                    "type": "bytes",
-                    "internalType": "bytes"
-                },
-                {
-                    "name": "privateInputs",
-                    "type": "tuple[]",
-                    "internalType": "struct ScheduleConsumer.PrivateInput[]",
-                    "components": [
-                        {
-                            "name": "name",
-                            "type": "string",
-                            "internalType": "string"
-                        },
-                        {
-                            "name": "encryptions",
-                            "type": "tuple[]",
-                            "internalType": "struct ScheduleConsumer.Encryption[]",
-                            "components": [
-                                {
-                                    "name": "recipient",
-                                    "type": "string",
-                                    "internalType": "string"
-                                },
-                                {
-                                    "name": "encrypted_value",
-                                    "type": "string",
-                                    "internalType": "string"
-                                }
-                            ]
-                        }
-                    ]
-                },
-                {
-                    "name": "gasLimit",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                },
-                {
-                    "name": "gasPrice",
-                    "type": "uint48",
-                    "internalType": "uint48"
-                },
-                {
-                    "name": "frequency",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                },
-                {
-                    "name": "numBlocks",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "payable"
-        },
-        {
-            "type": "function",
-            "name": "scheduleGenericCompute",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                },
-                {
-                    "name": "target",
-                    "type": "address",
-                    "internalType": "address"
-                },
-                {
-                    "name": "inputs",
-                    "type": "bytes",
-                    "internalType": "bytes"
-                },
-                {
-                    "name": "gasLimit",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                },
-                {
-                    "name": "gasPrice",
-                    "type": "uint48",
-                    "internalType": "uint48"
-                },
-                {
-                    "name": "frequency",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                },
-                {
-                    "name": "numBlocks",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "payable"
-        },
-        {
-            "type": "function",
-            "name": "scheduleNormal",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                },
-                {
-                    "name": "gasLimit",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                },
-                {
-                    "name": "gasPrice",
-                    "type": "uint48",
-                    "internalType": "uint48"
-                },
-                {
-                    "name": "frequency",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                },
-                {
-                    "name": "numBlocks",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "payable"
-        },
-        {
-            "type": "function",
-            "name": "scheduledComputeCallback",
-            "inputs": [
-                {
-                    "name": "jobId",
-                    "type": "string",
-                    "internalType": "string"
-                },
-                {
-                    "name": "sidecarId",
-                    "type": "uint8",
-                    "internalType": "uint8"
-                },
-                {
-                    "name": "inputs",
-                    "type": "bytes",
-                    "internalType": "bytes"
-                },
-                {
-                    "name": "privateInputs",
-                    "type": "tuple[]",
-                    "internalType": "struct ScheduleConsumer.PrivateInput[]",
-                    "components": [
-                        {
-                            "name": "name",
-                            "type": "string",
-                            "internalType": "string"
-                        },
-                        {
-                            "name": "encryptions",
-                            "type": "tuple[]",
-                            "internalType": "struct ScheduleConsumer.Encryption[]",
-                            "components": [
-                                {
-                                    "name": "recipient",
-                                    "type": "string",
-                                    "internalType": "string"
-                                },
-                                {
-                                    "name": "encrypted_value",
-                                    "type": "string",
-                                    "internalType": "string"
-                                }
-                            ]
-                        }
-                    ]
-                },
-                {
-                    "name": "deadline",
-                    "type": "uint32",
-                    "internalType": "uint32"
-                }
-            ],
-            "outputs": [],
-            "stateMutability": "nonpayable"
-        },
-        {
-            "type": "function",
-            "name": "scheduler",
-            "inputs": [],
-            "outputs": [
-                {
-                    "name": "",
-                    "type": "address",
-                    "internalType": "contract Scheduler"
-                }
-            ],
-            "stateMutability": "view"
-        },
-        {
-            "type": "event",
-            "name": "ScheduledJobCreated",
-            "inputs": [
-                {
-                    "name": "jobid",
-                    "type": "string",
-                    "indexed": False,
-                    "internalType": "string"
-                },
-                {
-                    "name": "callId",
-                    "type": "uint256",
-                    "indexed": False,
-                    "internalType": "uint256"
-                }
-            ],
-            "anonymous": False
-        }
-    ],
-    "schedule_fn": "scheduleNormal",
-    "cancel_fn": "cancelJob"
-}
+
+@functools.cache
+def get_mock_ritual_config() -> RitualConfig:
+    """Get the parsed MockConfig.
+    
+    Parsed on first use and shared by every mock-mode toolkit afterwards.
+    
+    Returns:
+        RitualConfig: Parsed mock configuration
+    """
+    return load_ritual_config(_load_mock_config())
 
 
 class MockRitualAPI:
@@ -496,9 +47,28 @@ class MockRitualAPI:
     blockchain calls. It's useful for testing and development.
     """
     
-    def __init__(self):
-        """Initialize mock API."""
-        self.scheduled_jobs = {}
+    def __init__(self, store_payloads: bool = False):
+        """Initialize mock API.
+        
+        Args:
+            store_payloads: Also keep each scheduled job's kwargs in
+                ``job_payloads`` for inspection. Off by default, since only
+                job ids are needed to validate cancels.
+        """
+        self.scheduled_jobs: set[str] = set()
+        self.store_payloads = store_payloads
+        self.job_payloads: dict = {}
+        # Method name -> (result message prefix, sender) for run()
+        self._dispatch = {
+            "schedule_transaction": (
+                "Mock schedule transaction successful. Transaction hash: 0x",
+                self._send_scheduled_transaction,
+            ),
+            "cancel_scheduled_transaction": (
+                "Mock cancel transaction successful. Transaction hash: 0x",
+                self._send_cancel_scheduled_transaction,
+            ),
+        }
         
     def _send_scheduled_transaction(self, **kwargs):
         """Mock scheduling a transaction.
@@ -510,8 +80,10 @@ class MockRitualAPI:
             str: Mock transaction hash
         """
         job_id = kwargs.get("jobId")
-        self.scheduled_jobs[job_id] = kwargs
-        return uuid.uuid4().hex
+        self.scheduled_jobs.add(job_id)
+        if self.store_payloads:
+            self.job_payloads[job_id] = kwargs
+        return token_hex(16)
         
     def _send_cancel_scheduled_transaction(self, **kwargs):
         """Mock canceling a scheduled transaction.
@@ -526,11 +98,13 @@ class MockRitualAPI:
             ValueError: If job_id doesn't exist
         """
         job_id = kwargs.get("jobId")
-        if job_id not in self.scheduled_jobs:
+        try:
+            self.scheduled_jobs.remove(job_id)
+        except KeyError:
             raise ValueError(f"No scheduled job found with id {job_id}")
-            
-        del self.scheduled_jobs[job_id]
-        return uuid.uuid4().hex
+        if self.store_payloads:
+            self.job_payloads.pop(job_id, None)
+        return token_hex(16)
         
     def run(self, method: str, *args: Any, **kwargs: Any) -> str:
         """Run a mock operation.
@@ -546,13 +120,42 @@ class MockRitualAPI:
         Raises:
             ValueError: If method is unknown
         """
-        if method == "schedule_transaction":
-            tx_hash = self._send_scheduled_transaction(**kwargs)
-            return f"Mock schedule transaction successful. Transaction hash: 0x{tx_hash}"
-            
-        elif method == "cancel_scheduled_transaction":
-            tx_hash = self._send_cancel_scheduled_transaction(**kwargs)
-            return f"Mock cancel transaction successful. Transaction hash: 0x{tx_hash}"
-            
-        else:
+        try:
+            prefix, send = self._dispatch[method]
+        except KeyError:
             raise ValueError(f"Unknown method: {method}")
+        return prefix + send(**kwargs)
+
+    async def arun(self, method: str, *args: Any, **kwargs: Any) -> str:
+        """Async :meth:`run`, executed on the default thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.run, method, *args, **kwargs)
+        )
+
+    def run_batch(
+        self, calls: list[tuple[str, dict[str, Any]]], batch_size: int = None
+    ) -> list[str | Exception]:
+        """Run several mock operations in order.
+
+        Args:
+            calls: ``(method, kwargs)`` pairs, as accepted by :meth:`run`
+            batch_size: Ignored; accepted for parity with RitualAPI
+
+        Returns:
+            list[str | Exception]: Result message, or the exception that
+                call failed with, in the same order as ``calls``
+
+        Raises:
+            ValueError: If a method is unknown; raised before any call runs
+        """
+        for method, _ in calls:
+            if method not in self._dispatch:
+                raise ValueError(f"Unknown method: {method}")
+
+        results = []
+        for method, kwargs in calls:
+            try:
+                results.append(self.run(method, **kwargs))
+            except Exception as exc:
+                results.append(exc)
+        return results
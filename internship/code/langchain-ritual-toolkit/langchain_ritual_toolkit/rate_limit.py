@@ -0,0 +1,70 @@
+"""Rate limiting for Ritual API calls.
+
+Agents can loop on a tool and fire the same blockchain operation over and
+over; a small sliding-window limiter keeps that from turning into an RPC
+flood.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call would exceed the configured rate limit."""
+
+
+class SlidingWindowRateLimiter:
+    """Allow at most ``max_calls`` calls in any ``window`` seconds.
+    
+    Attributes:
+        max_calls: Maximum number of calls allowed per window
+        window: Window length in seconds
+    """
+
+    def __init__(self, max_calls: int = 10, window: float = 10.0):
+        self.max_calls = max_calls
+        self.window = window
+        self._calls: deque = deque()
+        self._lock = threading.Lock()
+
+    def check(self, count: int = 1) -> None:
+        """Record ``count`` calls, or raise without recording any.
+
+        Reserving a whole batch at once means a batch that doesn't fit
+        consumes no quota, instead of using up part of it and then failing.
+
+        Args:
+            count: Number of calls to reserve together
+
+        Raises:
+            RateLimitExceeded: If the ``count`` calls would push the last
+                ``window`` seconds past ``max_calls``
+        """
+        if count > self.max_calls:
+            raise RateLimitExceeded(
+                f"Cannot reserve {count} calls at once; the rate limit is "
+                f"{self.max_calls} calls per {self.window}s"
+            )
+        now = time.monotonic()
+        with self._lock:
+            calls = self._calls
+            while calls and now - calls[0] >= self.window:
+                calls.popleft()
+            if (excess := len(calls) + count - self.max_calls) > 0:
+                # Wait until enough of the oldest calls leave the window
+                retry_after = self.window - (now - calls[excess - 1])
+                raise RateLimitExceeded(
+                    f"Rate limit of {self.max_calls} calls per {self.window}s "
+                    f"exceeded; retry in {retry_after:.1f}s"
+                )
+            calls.extend([now] * count)
+
+    def release(self, count: int = 1) -> None:
+        """Give back the most recent ``count`` recorded calls.
+
+        For undoing a reservation that was never used.
+        """
+        with self._lock:
+            for _ in range(min(count, len(self._calls))):
+                self._calls.pop()
@@ -4,13 +4,37 @@ This tool allows agents to interact with the Ritual network.
 
 from __future__ import annotations
 
-from typing import Any, Optional, Type, Union
+import functools
+import inspect
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    Union,
+)
 
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, SkipValidation
 
-from langchain_ritual_toolkit.api import RitualAPI
-from langchain_ritual_toolkit.mock import MockRitualAPI
+
+class RitualAPILike(Protocol):
+    """Interface shared by RitualAPI and MockRitualAPI."""
+
+    def run(self, method: str, *args: Any, **kwargs: Any) -> str:
+        ...
+
+    async def arun(self, method: str, *args: Any, **kwargs: Any) -> str:
+        ...
+
+    def run_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Union[str, Exception]]:
+        ...
 
 
 class RitualTool(BaseTool):
@@ -30,10 +54,28 @@ class RitualTool(BaseTool):
     name: str = ""
     description: str = ""
     method: str
-    ritual_api: Union[RitualAPI, MockRitualAPI] = Field(
+    # Typed structurally and not validated: pydantic has nothing to coerce
+    # here, so skip the per-instance union isinstance checks.
+    ritual_api: SkipValidation[RitualAPILike] = Field(
         ..., description="API instance for blockchain interactions"
     )
     args_schema: Optional[Type[BaseModel]] = None
+    _runner: Callable[..., str] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Bind ``ritual_api.run`` to this tool's method once.
+
+        Raises:
+            TypeError: If ``ritual_api.run`` is a coroutine function (e.g.
+                AsyncRitualAPI), which ``_run`` would return un-awaited
+        """
+        super().model_post_init(__context)
+        if inspect.iscoroutinefunction(self.ritual_api.run):
+            raise TypeError(
+                f"{type(self.ritual_api).__name__}.run is async; RitualTool "
+                "needs a RitualAPILike with a synchronous run()"
+            )
+        self._runner = functools.partial(self.ritual_api.run, self.method)
 
     def _run(
         self,
@@ -52,4 +94,32 @@ class RitualTool(BaseTool):
         Raises:
             Exception: If the operation fails
         """
-        return self.ritual_api.run(self.method, *args, **kwargs)
\ No newline at end of file
+        return self._runner(*args, **kwargs)
+
+    async def _arun(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> str:
+        """Run the tool asynchronously.
+
+        Args:
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            str: Result of the operation
+        """
+        return await self.ritual_api.arun(self.method, *args, **kwargs)
+
+    def batch_run(self, batch: List[Dict[str, Any]]) -> List[Union[str, Exception]]:
+        """Run the tool once per set of arguments in a single batch.
+
+        Args:
+            batch: Keyword arguments for each call
+
+        Returns:
+            List[Union[str, Exception]]: Result of each operation, or the
+                exception it failed with, in order
+        """
+        return self.ritual_api.run_batch([(self.method, kwargs) for kwargs in batch])
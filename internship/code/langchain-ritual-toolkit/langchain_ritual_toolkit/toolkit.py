@@ -13,13 +13,13 @@ Example:
     >>> tools = toolkit.get_tools()
 """
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from pydantic import PrivateAttr
 
 from langchain_ritual_toolkit.api import RitualAPI
 from langchain_ritual_toolkit.configuration import RitualConfig, load_ritual_config
-from langchain_ritual_toolkit.mock import MockRitualAPI, MockConfig
+from langchain_ritual_toolkit.mock import MockRitualAPI, get_mock_ritual_config
 from langchain_ritual_toolkit.tool import RitualTool
 from langchain_ritual_toolkit.tools import generate_tools
 
@@ -35,12 +35,14 @@ class RitualToolkit:
         mock_mode: Whether to use mock mode instead of real blockchain
         private_key: Ethereum private key (only required if not in mock mode)
         rpc_url: Ethereum RPC URL (only required if not in mock mode)
-        _tools: List of LangChain tools for Ritual operations
+        _tool_specs: Tool specs from generate_tools, keyed by tool name
+        _tool_cache: Tools built so far, keyed by tool name
         _ritual_api: API instance for blockchain interactions
         _ritual_config: Ritual network configuration
     """
     
-    _tools: List[RitualTool] = PrivateAttr(default=[])
+    _tool_specs: Dict[str, dict] = PrivateAttr(default=None)
+    _tool_cache: Dict[str, RitualTool] = PrivateAttr(default=None)
     _ritual_api: Union[RitualAPI, MockRitualAPI] = PrivateAttr(default=None)
     _ritual_config: RitualConfig = PrivateAttr(default=None)
 
@@ -62,8 +64,6 @@ class RitualToolkit:
         Raises:
             ValueError: If private_key or rpc_url are missing in non-mock mode
         """
-        super().__init__()
-        
         if not mock_mode:
             if not private_key or not rpc_url:
                 raise ValueError(
@@ -74,19 +74,47 @@ class RitualToolkit:
             self._ritual_api = RitualAPI(private_key, rpc_url, self._ritual_config)
         
         else:
-            self._ritual_config = load_ritual_config(MockConfig)  # type: ignore[arg-type] # MockConfig
+            self._ritual_config = get_mock_ritual_config()
             self._ritual_api = MockRitualAPI()
             
-        self._tools = [
-            RitualTool(
-                name=tool["method"],
-                description=tool["description"],
-                method=tool["method"],
+        # Tool specs are generated, and tools built, only when first requested
+        self._tool_specs = None
+        self._tool_cache = {}
+
+    def _get_tool_specs(self) -> Dict[str, dict]:
+        if self._tool_specs is None:
+            self._tool_specs = {
+                tool["method"]: tool for tool in generate_tools(self._ritual_config)
+            }
+        return self._tool_specs
+
+    def _get_tool(self, name: str) -> RitualTool:
+        if (tool := self._tool_cache.get(name)) is None:
+            spec = self._get_tool_specs()[name]
+            tool = self._tool_cache[name] = RitualTool(
+                name=spec["method"],
+                description=spec["description"],
+                method=spec["method"],
                 ritual_api=self._ritual_api,
-                args_schema=tool.get("args_schema", None),
+                args_schema=spec.get("args_schema", None),
             )
-            for tool in generate_tools(self._ritual_config)
-        ]
+        return tool
+
+    def get_tool(self, name: str) -> RitualTool:
+        """Get a single toolkit tool without building the others.
+        
+        Args:
+            name: Tool name, e.g. "schedule_transaction"
+            
+        Returns:
+            The LangChain tool with that name
+            
+        Raises:
+            ValueError: If no tool has that name
+        """
+        if name not in self._get_tool_specs():
+            raise ValueError(f"Unknown tool: {name}")
+        return self._get_tool(name)
 
     def get_tools(self) -> List[RitualTool]:
         """Get toolkit tools.
@@ -94,4 +122,4 @@ class RitualToolkit:
         Returns:
             List of LangChain tools configured for Ritual operations
         """
-        return self._tools
\ No newline at end of file
+        return [self._get_tool(name) for name in self._get_tool_specs()]
@@ -1,5 +1,5 @@
-from collections import OrderedDict
-from typing import Dict, List
+import functools
+from typing import Callable, Dict, List, Tuple
 
 from pydantic import ConfigDict, create_model
 
@@ -10,55 +10,86 @@ from langchain_ritual_toolkit.prompts import (
 )
 
 
+# Generated tool args are immutable once validated
+_ARGS_CONFIG = ConfigDict(frozen=True)
+
+# Nested struct models keyed by structural signature, so identical structs
+# (e.g. the same PrivateInput[] on several functions) share one class
+_struct_cache: Dict[Tuple, type] = {}
+
+
 def create_type_model(components, name="NestedStruct"):
+    sig = _abi_signature(components)
+    if (model := _struct_cache.get(sig)) is not None:
+        return model
     field_definitions = {}
     for component in components:
         field_type = get_field_type(component)
         field_definitions[component.name] = (field_type, ...)
-    return create_model(name, **field_definitions)
+    model = _struct_cache[sig] = create_model(name, **field_definitions)
+    return model
 
-def get_field_type(input):
-    if hasattr(input, 'components') and input.components:
-        return create_type_model(input.components, f"{input.name.capitalize()}Struct")
-    
-    if input.type.startswith("uint") or input.type.startswith("int"):
+# Exact-match ABI types; integer and bytes families are prefix-matched below
+_SCALAR_TYPES = {"bool": bool, "address": str, "string": str}
+
+
+@functools.lru_cache(maxsize=None)
+def _scalar_field_type(abi_type: str) -> type:
+    if (field_type := _SCALAR_TYPES.get(abi_type)) is not None:
+        return field_type
+    if abi_type.startswith(("uint", "int")):
         return int
-    elif input.type == "bool":
-        return bool
-    elif input.type == "address":
-        return str
-    elif input.type.startswith("bytes"):
+    if abi_type.startswith("bytes"):
         return bytes
-    elif input.type == "string":
-        return str
     return str  # Default to str for unknown types
 
-def generate_schedule_transaction_tool(ritual_config: RitualConfig) -> Dict:
-    schedule_fn = ritual_config.schedule_fn
-    # find scheduled function by name from config abi
+def get_field_type(input):
+    if input.components:
+        model = create_type_model(input.components, f"{input.name.capitalize()}Struct")
+        return List[model] if input.type.endswith("[]") else model
+    return _scalar_field_type(input.type)
+
+# Generated tool specs keyed by (method, ABI function signature), so repeated
+# toolkit construction skips create_model and schema rendering
+_TOOL_SPEC_CACHE: Dict[Tuple, Dict] = {}
+
+
+def _abi_signature(inputs) -> Tuple:
+    """Hashable structural signature of ABI inputs."""
+    return tuple(
+        (
+            input.name,
+            input.type,
+            _abi_signature(input.components)
+            if input.components
+            else None,
+        )
+        for input in inputs or ()
+    )
 
-    schedule_abi_item = None
-    for item in ritual_config.abi:
-        if item.name == schedule_fn:
-            schedule_abi_item = item
-            break
-    
-    if schedule_abi_item is None:
-        raise ValueError(f"Schedule function {schedule_fn} not found in ABI")
+def _cached_tool_spec(method: str, abi_item, build: Callable) -> Dict:
+    key = (method, abi_item.name, _abi_signature(abi_item.inputs))
+    if (spec := _TOOL_SPEC_CACHE.get(key)) is None:
+        spec = _TOOL_SPEC_CACHE[key] = build(abi_item)
+    return dict(spec)
 
-    field_definitions = OrderedDict()
+def _build_schedule_transaction_tool(schedule_abi_item) -> Dict:
+    field_definitions = {}
+    # The prompt lists the raw ABI types, which are more precise than the
+    # JSON-Schema types and avoid rendering the model's schema
+    desc_lines = []
     for input in schedule_abi_item.inputs:
         field_type = get_field_type(input)
         field_definitions[input.name] = (field_type, ...)
+        desc_lines.append(f"- {input.name} ({input.type})")
 
     ScheduleTransactionArgs = create_model(
         'ScheduleTransactionArgs',
-        __config__=ConfigDict(frozen=True),  # This ensures order preservation
+        __config__=_ARGS_CONFIG,
         **field_definitions
     )
 
-    schema = ScheduleTransactionArgs.schema()
-    args_description = "\n".join([f"- {prop} ({schema['properties'][prop]['type']})" for prop in schema['properties']])
+    args_description = "\n".join(desc_lines)
     schedule_transaction_prompt = SCHEDULE_TRANSACTION_PROMPT.replace("{{args}}", args_description)
 
     return {
@@ -68,31 +99,49 @@ def generate_schedule_transaction_tool(ritual_config: RitualConfig) -> Dict:
         "args_schema": ScheduleTransactionArgs,
     }
 
-def generate_cancel_scheduled_transaction_tool(ritual_config: RitualConfig) -> Dict:
-    cancel_fn = ritual_config.cancel_fn
-    # find cancel function by name from config abi
-    cancel_abi_item = None
-    for item in ritual_config.abi:
-        if item.name == cancel_fn:
-            cancel_abi_item = item
-            break
-    
-    if cancel_abi_item is None:
-        raise ValueError(f"Cancel function {cancel_fn} not found in ABI")
+@functools.lru_cache(maxsize=None)
+def _single_arg_cancel_model(name: str, field_type: type):
+    """Args model for the common one-scalar cancel signature, e.g. cancelJob(string)."""
+    return create_model(
+        'CancelScheduledTransactionArgs',
+        __config__=_ARGS_CONFIG,
+        **{name: (field_type, ...)},
+    )
+
+def _build_cancel_scheduled_transaction_tool(cancel_abi_item) -> Dict:
+    inputs = cancel_abi_item.inputs
+    if len(inputs) == 1 and not inputs[0].components:
+        # Shared across configs whose cancel function takes the same argument
+        input = inputs[0]
+        CancelScheduledTransactionArgs = _single_arg_cancel_model(
+            input.name, _scalar_field_type(input.type)
+        )
+        args_description = f"- {input.name} ({input.type})"
+        return {
+            "method": "cancel_scheduled_transaction",
+            "name": "Cancel Scheduled Transaction",
+            "description": CANCEL_SCHEDULED_TRANSACTION_PROMPT.replace(
+                "{{args}}", args_description
+            ),
+            "args_schema": CancelScheduledTransactionArgs,
+        }
 
-    field_definitions = OrderedDict()
+    field_definitions = {}
+    # The prompt lists the raw ABI types, which are more precise than the
+    # JSON-Schema types and avoid rendering the model's schema
+    desc_lines = []
     for input in cancel_abi_item.inputs:
         field_type = get_field_type(input)
         field_definitions[input.name] = (field_type, ...)
+        desc_lines.append(f"- {input.name} ({input.type})")
 
     CancelScheduledTransactionArgs = create_model(
         'CancelScheduledTransactionArgs',
-        __config__=ConfigDict(frozen=True),  # This ensures order preservation
+        __config__=_ARGS_CONFIG,
         **field_definitions
     )
 
-    schema = CancelScheduledTransactionArgs.schema()
-    args_description = "\n".join([f"- {prop} ({schema['properties'][prop]['type']})" for prop in schema['properties']])
+    args_description = "\n".join(desc_lines)
     cancel_scheduled_transaction_prompt = CANCEL_SCHEDULED_TRANSACTION_PROMPT.replace("{{args}}", args_description)
 
     return {
@@ -102,6 +151,32 @@ def generate_cancel_scheduled_transaction_tool(ritual_config: RitualConfig) -> D
         "args_schema": CancelScheduledTransactionArgs,
     }
 
+def generate_schedule_transaction_tool(ritual_config: RitualConfig) -> Dict:
+    schedule_fn = ritual_config.schedule_fn
+    # find scheduled function by name from config abi
+    try:
+        schedule_abi_item = ritual_config.abi[ritual_config.abi_index[schedule_fn]]
+    except KeyError:
+        raise ValueError(f"Schedule function {schedule_fn} not found in ABI")
+
+    return _cached_tool_spec(
+        "schedule_transaction", schedule_abi_item, _build_schedule_transaction_tool
+    )
+
+def generate_cancel_scheduled_transaction_tool(ritual_config: RitualConfig) -> Dict:
+    cancel_fn = ritual_config.cancel_fn
+    # find cancel function by name from config abi
+    try:
+        cancel_abi_item = ritual_config.abi[ritual_config.abi_index[cancel_fn]]
+    except KeyError:
+        raise ValueError(f"Cancel function {cancel_fn} not found in ABI")
+
+    return _cached_tool_spec(
+        "cancel_scheduled_transaction",
+        cancel_abi_item,
+        _build_cancel_scheduled_transaction_tool,
+    )
+
 def generate_tools(ritual_config: RitualConfig) -> List[Dict]:
     return [
         generate_schedule_transaction_tool(ritual_config),
@@ -4,8 +4,9 @@ setup(
     name="langchain_ritual_toolkit",
     version="0.1.0",
     packages=find_packages(),
+    package_data={"langchain_ritual_toolkit": ["mock_abi.json"]},
     install_requires=[
         "langchain>=0.0.300",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
 )
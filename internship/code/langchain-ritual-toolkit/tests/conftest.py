@@ -0,0 +1,180 @@
+"""Fixtures for the langchain-ritual-toolkit tests.
+
+The API tests run against a small in-process JSON-RPC node that answers just
+the calls RitualAPI makes, so no chain or network access is needed.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import rlp
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+
+from langchain_ritual_toolkit.configuration import RitualConfig, load_ritual_config
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parents[1] / "examples" / "ritual_config.json"
+
+ZERO_HASH = "0x" + "00" * 32
+BLOCK = {
+    "number": "0x1",
+    "hash": ZERO_HASH,
+    "timestamp": "0x1",
+    "gasLimit": "0x1c9c380",
+    "gasUsed": "0x0",
+    "baseFeePerGas": "0x1",
+    "transactions": [],
+}
+
+
+def tx_nonce(raw_tx: str) -> int:
+    """Nonce of a signed raw transaction, legacy or typed."""
+    raw = HexBytes(raw_tx)
+    if raw[0] > 0x7F:
+        # Legacy transactions are a bare RLP list starting with the nonce
+        return int.from_bytes(rlp.decode(raw)[0], "big")
+    return TypedTransaction.from_bytes(raw).as_dict()["nonce"]
+
+
+class StubNode:
+    """Minimal JSON-RPC node for exercising RitualAPI.
+
+    Attributes:
+        url: HTTP endpoint to hand to RitualAPI
+        calls: Number of requests seen per JSON-RPC method
+        posts: JSON-RPC methods carried by each HTTP POST, in arrival order
+        sent: Raw transactions received, in arrival order
+        nonces: Nonce of each transaction in ``sent``
+        reject: Indexes into ``sent`` the node answers with an error
+        reject_nonces: Nonces whose next transaction the node rejects
+        rejected: Indexes into ``sent`` that were rejected
+        send_delay: Seconds the node takes to accept a transaction
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.posts = []
+        self.sent = []
+        self.nonces = []
+        self.reject = set()
+        self.reject_nonces = set()
+        self.rejected = set()
+        self.send_delay = 0.0
+        self._nonce = 0
+        self._lock = threading.Lock()
+
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                requests = body if isinstance(body, list) else [body]
+                with node._lock:
+                    node.posts.append([request["method"] for request in requests])
+                if isinstance(body, list):
+                    reply = [node.answer(request) for request in body]
+                else:
+                    reply = node.answer(body)
+                data = json.dumps(reply).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def answer(self, request: dict) -> dict:
+        method = request["method"]
+        if method == "eth_sendRawTransaction":
+            return self._send_raw(request)
+        with self._lock:
+            self.calls[method] += 1
+            if method == "eth_getTransactionReceipt":
+                return self._result(request, self._receipt(request["params"][0]))
+            results = {
+                "eth_chainId": "0x1",
+                "eth_getTransactionCount": hex(self._nonce),
+                "eth_estimateGas": "0x5208",
+                "eth_gasPrice": "0x1",
+                "eth_maxPriorityFeePerGas": "0x1",
+                "eth_getBlockByNumber": BLOCK,
+                "eth_blockNumber": "0x1",
+            }
+            return self._result(request, results[method])
+
+    def _send_raw(self, request: dict) -> dict:
+        with self._lock:
+            self.calls["eth_sendRawTransaction"] += 1
+            index = len(self.sent)
+            nonce = tx_nonce(request["params"][0])
+            self.sent.append(request["params"][0])
+            self.nonces.append(nonce)
+            if index in self.reject or nonce in self.reject_nonces:
+                self.reject_nonces.discard(nonce)
+                self.rejected.add(index)
+                return self._error(request, "transaction rejected")
+        # Accepted sends only count toward the pending nonce once answered
+        time.sleep(self.send_delay)
+        with self._lock:
+            self._nonce += 1
+        return self._result(request, "0x%064x" % (index + 1))
+
+    @staticmethod
+    def _receipt(tx_hash: str) -> dict:
+        return {
+            "status": "0x1",
+            "transactionHash": tx_hash,
+            "blockNumber": "0x1",
+            "blockHash": ZERO_HASH,
+            "transactionIndex": "0x0",
+            "from": "0x" + "00" * 20,
+            "to": "0x" + "00" * 20,
+            "cumulativeGasUsed": "0x1",
+            "gasUsed": "0x1",
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "contractAddress": None,
+            "effectiveGasPrice": "0x1",
+            "type": "0x2",
+        }
+
+    @staticmethod
+    def _result(request: dict, result) -> dict:
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    @staticmethod
+    def _error(request: dict, message: str) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "error": {"code": -32000, "message": message},
+        }
+
+
+@pytest.fixture
+def node():
+    """A fresh stub JSON-RPC node per test."""
+    stub = StubNode()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture(scope="session")
+def ritual_config() -> RitualConfig:
+    """The example contract config shipped with the toolkit."""
+    return load_ritual_config(str(EXAMPLE_CONFIG))
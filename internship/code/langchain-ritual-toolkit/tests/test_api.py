@@ -0,0 +1,72 @@
+"""Tests for RitualAPI.run_batch against a stub JSON-RPC node."""
+
+import pytest
+
+from langchain_ritual_toolkit.api import RitualAPI
+from langchain_ritual_toolkit.rate_limit import RateLimitExceeded
+
+PRIVATE_KEY = "0x" + "11" * 32
+
+
+def cancels(count: int) -> list:
+    return [("cancel_scheduled_transaction", {"jobId": str(i)}) for i in range(count)]
+
+
+@pytest.fixture
+def api(node, ritual_config) -> RitualAPI:
+    return RitualAPI(PRIVATE_KEY, node.url, ritual_config, poll_latency=0.01)
+
+
+def test_run_batch_returns_result_per_call(api, node):
+    results = api.run_batch(cancels(3))
+
+    assert all(r.startswith("Cancel transaction successful") for r in results)
+    assert node.nonces == [0, 1, 2]
+    # One batch POST carries all three sends
+    send_posts = [p for p in node.posts if "eth_sendRawTransaction" in p]
+    assert send_posts == [["eth_sendRawTransaction"] * 3]
+
+
+def test_run_batch_caps_chunks_at_rate_limit(node, ritual_config):
+    api = RitualAPI(
+        PRIVATE_KEY, node.url, ritual_config, poll_latency=0.01, max_calls=2
+    )
+
+    results = api.run_batch(cancels(3), batch_size=20)
+
+    # The first chunk of 2 is sent; the next one is over quota and sends nothing
+    assert [isinstance(r, str) for r in results] == [True, True, False]
+    assert isinstance(results[2], RateLimitExceeded)
+    assert len(node.sent) == 2
+
+
+def test_run_batch_over_quota_consumes_nothing(node, ritual_config):
+    api = RitualAPI(
+        PRIVATE_KEY, node.url, ritual_config, poll_latency=0.01, max_calls=2
+    )
+    api.run_batch(cancels(1))
+
+    results = api.run_batch(cancels(2))
+
+    assert all(isinstance(r, RateLimitExceeded) for r in results)
+    assert len(node.sent) == 1
+    # The rejected chunk left the remaining call's quota intact
+    assert isinstance(api.run_batch(cancels(1))[0], str)
+
+
+def test_run_batch_fills_rejected_nonce(api, node):
+    node.reject = {1}
+
+    results = api.run_batch(cancels(3))
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], RuntimeError)
+    assert isinstance(results[2], str)
+    # Nonce 1 was rejected, then refilled so nonce 2 can be mined
+    assert node.nonces == [0, 1, 2, 1]
+
+
+def test_run_batch_rejects_unknown_method_before_sending(api, node):
+    with pytest.raises(ValueError):
+        api.run_batch(cancels(1) + [("transfer", {})])
+    assert node.sent == []
@@ -0,0 +1,41 @@
+"""Tests for AsyncRitualAPI against a stub JSON-RPC node."""
+
+import asyncio
+
+from langchain_ritual_toolkit.api import AsyncRitualAPI
+
+PRIVATE_KEY = "0x" + "11" * 32
+
+
+def cancels(count: int) -> list:
+    return [("cancel_scheduled_transaction", {"jobId": str(i)}) for i in range(count)]
+
+
+def accepted_nonces(node) -> list:
+    return [nonce for i, nonce in enumerate(node.nonces) if i not in node.rejected]
+
+
+def test_run_many_failure_does_not_reuse_nonces(node, ritual_config):
+    api = AsyncRitualAPI(PRIVATE_KEY, node.url, ritual_config, poll_latency=0.01)
+    # The middle send is rejected while the others are still in flight
+    node.reject_nonces = {1}
+    node.send_delay = 0.5
+
+    async def late_send():
+        # Starts after the rejection, while the other sends are in flight
+        await asyncio.sleep(0.25)
+        return await api.run("cancel_scheduled_transaction", jobId="3")
+
+    async def run():
+        results, late = await asyncio.gather(
+            api.run_many(cancels(3)), late_send(), return_exceptions=True
+        )
+        return results + [late]
+
+    results = asyncio.run(run())
+
+    assert sum(isinstance(r, Exception) for r in results) == 1
+    assert sum(isinstance(r, str) for r in results) == 3
+    # Every accepted nonce is distinct and there is no gap left behind
+    nonces = accepted_nonces(node)
+    assert sorted(nonces) == list(range(len(nonces)))
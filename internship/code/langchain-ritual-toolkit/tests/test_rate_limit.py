@@ -0,0 +1,49 @@
+"""Tests for SlidingWindowRateLimiter."""
+
+import pytest
+
+from langchain_ritual_toolkit.rate_limit import (
+    RateLimitExceeded,
+    SlidingWindowRateLimiter,
+)
+
+
+def test_check_allows_up_to_max_calls():
+    limiter = SlidingWindowRateLimiter(max_calls=3, window=60)
+    for _ in range(3):
+        limiter.check()
+    with pytest.raises(RateLimitExceeded):
+        limiter.check()
+
+
+def test_check_many_is_all_or_nothing():
+    limiter = SlidingWindowRateLimiter(max_calls=5, window=60)
+    limiter.check(3)
+    with pytest.raises(RateLimitExceeded):
+        limiter.check(3)
+    # The rejected reservation consumed nothing
+    limiter.check(2)
+    with pytest.raises(RateLimitExceeded):
+        limiter.check()
+
+
+def test_check_rejects_more_than_max_calls_at_once():
+    limiter = SlidingWindowRateLimiter(max_calls=2, window=60)
+    with pytest.raises(RateLimitExceeded):
+        limiter.check(3)
+    limiter.check(2)
+
+
+def test_release_returns_quota():
+    limiter = SlidingWindowRateLimiter(max_calls=2, window=60)
+    limiter.check(2)
+    limiter.release(1)
+    limiter.check()
+    with pytest.raises(RateLimitExceeded):
+        limiter.check()
+
+
+def test_window_expiry_frees_quota():
+    limiter = SlidingWindowRateLimiter(max_calls=1, window=0)
+    limiter.check()
+    limiter.check()
@@ -0,0 +1,41 @@
+"""Tests for the tool specs generated from a contract ABI."""
+
+import pytest
+from pydantic import ValidationError
+
+from langchain_ritual_toolkit.tools import generate_tools
+
+
+def test_schedule_args_follow_abi_inputs(ritual_config):
+    schedule, _ = generate_tools(ritual_config)
+    args_schema = schedule["args_schema"]
+
+    assert list(args_schema.model_fields) == [
+        "jobId",
+        "gasLimit",
+        "gasPrice",
+        "frequency",
+        "numBlocks",
+    ]
+    assert args_schema.model_fields["jobId"].annotation is str
+    assert args_schema.model_fields["gasLimit"].annotation is int
+    assert "- gasPrice (uint48)" in schedule["description"]
+
+
+def test_cancel_args_schema(ritual_config):
+    _, cancel = generate_tools(ritual_config)
+
+    assert cancel["method"] == "cancel_scheduled_transaction"
+    assert list(cancel["args_schema"].model_fields) == ["jobId"]
+
+
+def test_args_models_are_frozen(ritual_config):
+    schedule, cancel = generate_tools(ritual_config)
+    args = schedule["args_schema"](
+        jobId="1", gasLimit=1, gasPrice=1, frequency=1, numBlocks=1
+    )
+
+    with pytest.raises(ValidationError):
+        args.gasLimit = 2
+    with pytest.raises(ValidationError):
+        cancel["args_schema"](jobId="1").jobId = "2"
@@ -1,28 +1,71 @@
 """Mock blockchain and contract implementations for testing."""
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence
 import logging
+import sys
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Amounts are held internally as integer wei; Decimal ETH is only used at the
+# public getters/setters.
+WEI_PER_ETH = 10**18
+
+# Shared by every transaction the mock contract creates
+_CONTRACT_ADDR = sys.intern("contract")
+_DEFAULT_HASH = sys.intern("0x123")
+_STATUS_SUCCESS = sys.intern("success")
+
+# Gas parameters of the mock contract's transactions, in wei / gas units
+_GAS_PRICE_20_GWEI = 20 * 10**9
+_GAS_PRICE_1_GWEI = 10**9
+_GAS_USED_STAKE = 100000
+
+# Read-only stand-in for an address with no position; only read, since the
+# paths that write through it raise on a zero amount first
+_NO_POSITION: Sequence[int] = (0, 0)
+# Returned by the getters for an address with no position
+_ZERO = Decimal(0)
+
+
+def to_wei(amount) -> int:
+    """Convert an ETH amount to integer wei."""
+    return int(Decimal(str(amount)) * WEI_PER_ETH)
+
+
+def from_wei(amount: int) -> Decimal:
+    """Convert integer wei to a Decimal ETH amount."""
+    return Decimal(amount) / WEI_PER_ETH
+
+
+@dataclass(slots=True)
 class MockAccount:
     """Mock account for testing."""
     address: str
-    balance: Decimal
+    balance: int  # wei
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockTransaction:
-    """Mock transaction for testing."""
+    """Mock transaction for testing.
+    
+    Immutable and hashable, so transactions can be deduplicated or used as
+    cache keys.
+    """
     hash: str
     from_address: str
     to_address: str
-    value: Decimal
+    value: int  # wei
     gas_used: int
-    gas_price: Decimal
+    gas_price: int  # wei
     status: str
     confirmed: bool = True
+    # gas_used * gas_price in wei; derived, so left out of eq/hash
+    gas_cost: int = field(init=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "gas_cost", self.gas_used * self.gas_price)
 
 
 class MockBlockchainState:
@@ -31,30 +74,33 @@ class MockBlockchainState:
     def __init__(self):
         """Initialize mock blockchain state."""
         self.accounts: Dict[str, MockAccount] = {}
-        self.gas_price = Decimal("1000000000")  # 1 gwei
+        self.gas_price = _GAS_PRICE_1_GWEI
         self.block_number = 1000000
 
     def get_account(self, address: str) -> MockAccount:
-        """Get account by address."""
-        if address not in self.accounts:
-            self.accounts[address] = MockAccount(
+        """Get account by address, creating it on first use."""
+        account = self.accounts.get(address)
+        if account is None:
+            # Interned so later lookups with the same key compare by identity
+            address = sys.intern(address)
+            account = self.accounts[address] = MockAccount(
                 address=address,
-                balance=Decimal("10.0")
+                balance=10 * WEI_PER_ETH
             )
-        return self.accounts[address]
+        return account
 
     def get_block_number(self) -> int:
         """Get current block number."""
         return self.block_number
 
     def get_balance(self, address: str) -> Decimal:
-        """Get balance for address."""
-        return self.get_account(address).balance
+        """Get balance for address in ETH."""
+        return from_wei(self.get_account(address).balance)
 
     def update_balance(self, address: str, amount: Decimal):
-        """Update balance for address."""
+        """Update balance for address from an ETH amount."""
         account = self.get_account(address)
-        account.balance = amount
+        account.balance = to_wei(amount)
 
     def apply_transaction(self, tx: MockTransaction):
         """Apply transaction effects to blockchain state.
@@ -66,29 +112,71 @@ class MockBlockchainState:
         Args:
             tx: Transaction to apply
         """
-        logger = logging.getLogger(__name__)
-        
         # Get accounts
         from_account = self.get_account(tx.from_address)
         to_account = self.get_account(tx.to_address)
         
-        # Calculate gas cost
-        gas_cost = Decimal(str(tx.gas_used)) * tx.gas_price
-        
-        # Log transaction details
-        logger.debug(f"Applying transaction:")
-        logger.debug(f"From: {tx.from_address} (balance: {from_account.balance})")
-        logger.debug(f"To: {tx.to_address} (balance: {to_account.balance})")
-        logger.debug(f"Value: {tx.value}")
-        logger.debug(f"Gas cost: {gas_cost}")
+        # Only format the log lines when someone will see them
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"Applying transaction:\n"
+                f"From: {tx.from_address} (balance: {from_account.balance})\n"
+                f"To: {tx.to_address} (balance: {to_account.balance})\n"
+                f"Value: {tx.value}\n"
+                f"Gas cost: {tx.gas_cost}"
+            )
         
         # Update balances
-        from_account.balance -= (tx.value + gas_cost)
+        from_account.balance -= tx.value + tx.gas_cost
         to_account.balance += tx.value
         
-        logger.debug(f"New balances:")
-        logger.debug(f"From: {tx.from_address} (balance: {from_account.balance})")
-        logger.debug(f"To: {tx.to_address} (balance: {to_account.balance})")
+        if debug:
+            logger.debug(
+                f"New balances:\n"
+                f"From: {tx.from_address} (balance: {from_account.balance})\n"
+                f"To: {tx.to_address} (balance: {to_account.balance})"
+            )
+
+    def apply_transactions(self, txs: Sequence[MockTransaction]):
+        """Apply the effects of several transactions at once.
+        
+        Equivalent to calling ``apply_transaction`` on each in order, but
+        sums the balance changes first so each account is written once.
+        
+        Args:
+            txs: Transactions to apply
+        """
+        deltas: Dict[str, int] = defaultdict(int)
+        for tx in txs:
+            deltas[tx.from_address] -= tx.value + tx.gas_cost
+            deltas[tx.to_address] += tx.value
+        
+        for address, delta in deltas.items():
+            self.get_account(address).balance += delta
+
+
+class _PositionView(Mapping[str, Decimal]):
+    """Live, read-only ETH view of one field of the contract's positions.
+
+    Each lookup converts just that address's wei amount, and there is no
+    ``__setitem__``, so writes raise TypeError instead of being lost.
+    """
+
+    __slots__ = ("_positions", "_index")
+
+    def __init__(self, positions: Dict[str, List[int]], index: int):
+        self._positions = positions
+        self._index = index
+
+    def __getitem__(self, address: str) -> Decimal:
+        return from_wei(self._positions[address][self._index])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
 
 
 class MockStakingContract:
@@ -101,27 +189,32 @@ class MockStakingContract:
             blockchain: Optional blockchain state for gas calculations
         """
         self.blockchain = blockchain
-        self._staked: Dict[str, Decimal] = {}
-        self._rewards: Dict[str, Decimal] = {}
-        self.GAS_LIMIT = 100000
+        # address -> [staked, rewards] in wei, so each operation hashes the
+        # address once and updates both values in place
+        self._positions: Dict[str, List[int]] = {}
+        self._staked_view = _PositionView(self._positions, 0)
+        self._rewards_view = _PositionView(self._positions, 1)
+        self.GAS_LIMIT = _GAS_USED_STAKE
 
     @property
-    def staked(self) -> Dict[str, Decimal]:
-        """Get staked amounts."""
-        return self._staked
+    def staked(self) -> Mapping[str, Decimal]:
+        """Get a read-only view of staked amounts in ETH."""
+        return self._staked_view
 
     @property
-    def rewards(self) -> Dict[str, Decimal]:
-        """Get reward amounts."""
-        return self._rewards
+    def rewards(self) -> Mapping[str, Decimal]:
+        """Get a read-only view of reward amounts in ETH."""
+        return self._rewards_view
 
     def get_staked_amount(self, address: str) -> Decimal:
-        """Get staked amount for address."""
-        return self._staked.get(address, Decimal("0"))
+        """Get staked amount for address in ETH."""
+        pos = self._positions.get(address)
+        return _ZERO if pos is None else from_wei(pos[0])
 
     def get_rewards(self, address: str) -> Decimal:
-        """Get unclaimed rewards for address."""
-        return self._rewards.get(address, Decimal("0"))
+        """Get unclaimed rewards for address in ETH."""
+        pos = self._positions.get(address)
+        return _ZERO if pos is None else from_wei(pos[1])
 
     def get_apr(self) -> str:
         """Get current APR."""
@@ -129,77 +222,85 @@ class MockStakingContract:
 
     def stake(self, address: str, amount: Decimal) -> MockTransaction:
         """Stake tokens."""
-        self._staked[address] = self._staked.get(address, Decimal("0")) + amount
+        amount = to_wei(amount)
+        self._positions.setdefault(address, [0, 0])[0] += amount
         return MockTransaction(
-            hash="0x123",
+            hash=_DEFAULT_HASH,
             from_address=address,
-            to_address="contract",
+            to_address=_CONTRACT_ADDR,
             value=amount,
-            gas_used=100000,
-            gas_price=Decimal("20000000000"),  # 20 gwei
-            status="success"
+            gas_used=_GAS_USED_STAKE,
+            gas_price=_GAS_PRICE_20_GWEI,
+            status=_STATUS_SUCCESS
         )
 
     def unstake(self, address: str, amount: Decimal) -> MockTransaction:
         """Unstake tokens."""
-        if amount > self._staked.get(address, Decimal("0")):
+        amount = to_wei(amount)
+        pos = self._positions.get(address)
+        if pos is None or amount > pos[0]:
             raise ValueError("Insufficient staked balance")
-        self._staked[address] -= amount
+        pos[0] -= amount
         return MockTransaction(
-            hash="0x123",
-            from_address="contract",
+            hash=_DEFAULT_HASH,
+            from_address=_CONTRACT_ADDR,
             to_address=address,
             value=amount,
-            gas_used=100000,
-            gas_price=Decimal("20000000000"),  # 20 gwei
-            status="success"
+            gas_used=_GAS_USED_STAKE,
+            gas_price=_GAS_PRICE_20_GWEI,
+            status=_STATUS_SUCCESS
         )
 
     def claim_rewards(self, address: str) -> MockTransaction:
         """Claim rewards."""
-        amount = self._rewards.get(address, Decimal("0"))
+        pos = self._positions.get(address, _NO_POSITION)
+        amount = pos[1]
         if amount == 0:
             raise ValueError("No rewards to claim")
-        self._rewards[address] = Decimal("0")
+        pos[1] = 0
         return MockTransaction(
-            hash="0x123",
-            from_address="contract",
+            hash=_DEFAULT_HASH,
+            from_address=_CONTRACT_ADDR,
             to_address=address,
             value=amount,
-            gas_used=100000,
-            gas_price=Decimal("1000000000"),
-            status="success"
+            gas_used=_GAS_USED_STAKE,
+            gas_price=_GAS_PRICE_1_GWEI,
+            status=_STATUS_SUCCESS
         )
 
     def compound(self, address: str) -> MockTransaction:
         """Compound rewards."""
-        logger = logging.getLogger(__name__)
-        
-        logger.debug(f"Starting compound for address {address}")
-        logger.debug(f"Current staked amount: {self._staked.get(address, Decimal('0'))}")
-        logger.debug(f"Current rewards: {self._rewards.get(address, Decimal('0'))}")
+        pos = self._positions.get(address, _NO_POSITION)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"Starting compound for address {address}\n"
+                f"Current staked amount: {pos[0]}\n"
+                f"Current rewards: {pos[1]}"
+            )
         
-        rewards = self._rewards.get(address, Decimal("0"))
+        rewards = pos[1]
         if rewards == 0:
-            logger.error(f"No rewards to compound for address {address}")
+            logger.error("No rewards to compound for address %s", address)
             raise ValueError("No rewards to compound")
             
-        self._rewards[address] = Decimal("0")
-        current_stake = self._staked.get(address, Decimal("0"))
-        new_stake = current_stake + rewards
-        self._staked[address] = new_stake
+        pos[0] += rewards
+        pos[1] = 0
         
-        logger.debug(f"After compound - New staked amount: {new_stake}")
-        logger.debug(f"After compound - Remaining rewards: {self._rewards[address]}")
+        if debug:
+            logger.debug(
+                f"After compound - New staked amount: {pos[0]}\n"
+                f"After compound - Remaining rewards: {pos[1]}"
+            )
         
         return MockTransaction(
-            hash="0x123",
+            hash=_DEFAULT_HASH,
             from_address=address,
-            to_address="contract",
+            to_address=_CONTRACT_ADDR,
             value=rewards,
-            gas_used=100000,
-            gas_price=Decimal("1000000000"),
-            status="success"
+            gas_used=_GAS_USED_STAKE,
+            gas_price=_GAS_PRICE_1_GWEI,
+            status=_STATUS_SUCCESS
         )
 
     def get_compound_history(self, address: str) -> Dict[str, str]:
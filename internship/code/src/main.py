@@ -14,13 +14,16 @@ from dotenv import load_dotenv
 from langchain.agents import AgentExecutor
 from langchain_core.language_models import BaseLLM
 
-# Configure logging
+# Configure logging. The level defaults to WARNING so the per-step INFO
+# dumps from the LLM callbacks stay off unless LOG_LEVEL asks for them; the
+# log file is only opened once something is actually written.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, LOG_LEVEL, logging.WARNING),
     format="%(asctime)s [%(levelname)s] %(message)s",
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler("staking_optimizer.log"),
+        logging.FileHandler("staking_optimizer.log", delay=True),
     ],
 )
 
@@ -1,12 +1,14 @@
 """StakingOptimizer agent implementation."""
+import asyncio
+import functools
 import os
-from typing import Dict, List, Optional, Union
-from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional, Tuple, Union
 import uuid
 import logging
 import json
 from decimal import Decimal
 
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_core.prompts import PromptTemplate
@@ -20,26 +22,35 @@ from .character import StakeMateCharacter
 from ..safety.validator import SafetyValidator
 from ..operations.staking import StakingOperations
 from ..operations.view import get_staking_position
-from ..commands.parser import CommandParser
+from ..commands.parser import CommandParser, is_help_request
 from ..commands.models import (
     StakingCommand, StakeCommand, UnstakeCommand,
     CompoundCommand, ViewCommand, InformationalCommand
 )
 from .models import AgentResponse
+from ..utils.env import load_dotenv_once
 
 logger = logging.getLogger(__name__)
 
 class OpenAILoggingHandler(BaseCallbackHandler):
-    """Callback handler for logging OpenAI interactions."""
+    """Callback handler for logging OpenAI interactions.
+    
+    Everything except errors is logged at INFO, so each callback returns
+    before dumping prompts or responses when INFO is disabled.
+    """
     
     def on_llm_start(self, serialized, prompts, **kwargs):
         """Log when LLM starts generating."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\n{'='*50}\nLLM Request:")
         for i, prompt in enumerate(prompts):
             logger.info(f"Prompt {i}:\n{prompt}\n")
     
     def on_llm_end(self, response, **kwargs):
         """Log when LLM finishes generating."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\nLLM Response:")
         try:
             # Try to get function call details
@@ -62,11 +73,15 @@ class OpenAILoggingHandler(BaseCallbackHandler):
         
     def on_tool_start(self, serialized, input_str, **kwargs):
         """Log when a tool starts."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\nTool Start: {serialized.get('name', 'Unknown Tool')}")
         logger.info(f"Input: {input_str}")
         
     def on_tool_end(self, output, **kwargs):
         """Log when a tool ends."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\nTool Output: {output}")
         
     def on_tool_error(self, error, **kwargs):
@@ -75,16 +90,22 @@ class OpenAILoggingHandler(BaseCallbackHandler):
 
     def on_chain_start(self, serialized, inputs, **kwargs):
         """Log when a chain starts."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\nChain Start: {serialized.get('name', 'Unknown Chain')}")
         logger.info(f"Inputs: {json.dumps(inputs, indent=2)}")
 
     def on_chain_end(self, outputs, **kwargs):
         """Log when a chain ends."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\nChain Output:")
         logger.info(f"Outputs: {json.dumps(outputs, indent=2)}")
 
     def on_agent_action(self, action, **kwargs):
         """Log agent actions."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\nAgent Action:")
         logger.info(f"Tool: {action.tool}")
         logger.info(f"Input: {action.tool_input}")
@@ -92,11 +113,24 @@ class OpenAILoggingHandler(BaseCallbackHandler):
 
     def on_agent_finish(self, finish, **kwargs):
         """Log agent finish."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"\nAgent Finish:")
         logger.info(f"Output: {finish.return_values}")
         logger.info(f"Log: {finish.log}")
 
 
+_HELP_MSG = """I can help you with:
+
+- Staking and unstaking tokens
+- Viewing your staking position
+- Monitoring APR changes
+- Compounding rewards
+- Optimizing your returns
+
+Just ask me what you'd like to do!"""
+
+
 # Create prompt template for the agent
 AGENT_PROMPT = PromptTemplate.from_template(
     """You are StakeMate, a helpful staking assistant. You help users optimize their staking positions by:
@@ -185,6 +219,8 @@ class StakingOptimizerAgent:
         compound_strategy: Optional["ThresholdStrategy"] = None,
         mock_blockchain: Optional["MockBlockchainState"] = None,
         mock_contract: Optional["MockStakingContract"] = None,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the StakingOptimizer agent.
 
@@ -199,16 +235,20 @@ class StakingOptimizerAgent:
             compound_strategy: Optional compound strategy instance
             mock_blockchain: Optional mock blockchain state for testing
             mock_contract: Optional mock staking contract for testing
+            http_client: Optional shared HTTP client for LLM calls
+            http_async_client: Optional shared async HTTP client for LLM calls
         """
         # Load environment variables
-        load_dotenv()
+        load_dotenv_once()
 
         # Initialize components
         self.llm = ChatOpenAI(
             model_name=model_name,
             temperature=temperature,
             callbacks=[OpenAILoggingHandler()],
-            base_url=os.getenv("OPENAI_BASE_URL", "https://openrouter.ai/api/v1")
+            base_url=os.getenv("OPENAI_BASE_URL", "https://openrouter.ai/api/v1"),
+            http_client=http_client,
+            http_async_client=http_async_client,
         )
         self.toolkit = RitualToolkit(
             private_key=private_key,
@@ -225,11 +265,24 @@ class StakingOptimizerAgent:
         self.character = StakeMateCharacter()
         self.validator = safety_validator or SafetyValidator()
         self.operations = StakingOperations(self.toolkit, compound_strategy)
-        self.command_parser = command_parser or CommandParser()
+        self.command_parser = command_parser or CommandParser(
+            http_client=http_client, http_async_client=http_async_client
+        )
         self.compound_strategy = compound_strategy
+
+        # Command type -> handler for execute_command
+        self._dispatch = {
+            StakeCommand: self._exec_stake,
+            UnstakeCommand: self._exec_unstake,
+            CompoundCommand: self._exec_compound,
+            ViewCommand: self._exec_view,
+            InformationalCommand: self._exec_info,
+        }
         
         # Create agent with tools
-        self.tools = self._get_tools()
+        # Tools are fixed after init, so render their prompt text once
+        self._tools_doc = "\n".join(f"{tool.name}: {tool.description}" for tool in self.tools)
+        self._tool_names = ", ".join(tool.name for tool in self.tools)
         self.agent = create_react_agent(self.llm, self.tools, AGENT_PROMPT)
         self.agent_executor = AgentExecutor(
             agent=self.agent,
@@ -238,25 +291,17 @@ class StakingOptimizerAgent:
             async_mode=True  # Enable async mode
         )
 
-    def _get_tools(self):
+    @functools.cached_property
+    def tools(self):
         """Get the list of tools available to the agent.
+        
+        Built on first access and reused afterwards.
     
         Returns:
             List of LangChain tools for blockchain interactions.
         """
-        # If mock objects are provided, use them directly
-        if hasattr(self, 'blockchain') and hasattr(self, 'contract'):
-            return get_staking_tools(
-                self.blockchain,
-                self.contract,
-                self.validator
-            )
-        # Otherwise use the toolkit's API
-        return get_staking_tools(
-            self.toolkit.api.blockchain,
-            self.toolkit.api.contract,
-            self.validator
-        )
+        api = self.toolkit.api
+        return get_staking_tools(api.blockchain, api.contract, self.validator)
 
     def _validate_request(self, state: AgentState) -> bool:
         """Validate a user request.
@@ -292,8 +337,8 @@ class StakingOptimizerAgent:
             input_dict = {
                 "input": state.messages[0]["content"],
                 "agent_scratchpad": "",
-                "tools": "\n".join(f"{tool.name}: {tool.description}" for tool in self.tools),
-                "tool_names": ", ".join(tool.name for tool in self.tools)
+                "tools": self._tools_doc,
+                "tool_names": self._tool_names
             }
 
             # Run agent
@@ -316,21 +361,16 @@ class StakingOptimizerAgent:
             AgentResponse containing the result
         """
         try:
+            # Bare help requests don't need the parser
+            if is_help_request(request):
+                return AgentResponse(success=True, message=_HELP_MSG)
+
             # Parse request into command
             command = self.command_parser.parse_request(request)
             
             # Execute command
             if isinstance(command, InformationalCommand) and command.topic == "help":
-                help_msg = """I can help you with:
-
-- Staking and unstaking tokens
-- Viewing your staking position
-- Monitoring APR changes
-- Compounding rewards
-- Optimizing your returns
-
-Just ask me what you'd like to do!"""
-                return AgentResponse(success=True, message=help_msg)
+                return AgentResponse(success=True, message=_HELP_MSG)
             
             return await self.execute_command(command)
             
@@ -342,6 +382,62 @@ Just ask me what you'd like to do!"""
                 error=str(e)
             )
 
+    async def handle_request_batch(self, requests: List[str]) -> List[AgentResponse]:
+        """Handle several user requests, parsing them with concurrent LLM calls.
+        
+        The parser sends one LLM request per message, concurrently. Commands
+        for the same address then run in request order, so each address sees
+        the same results as calling ``handle_request`` on its requests in
+        turn. Different addresses run concurrently, so a slow call for one
+        address doesn't hold up the rest of the batch.
+        
+        Args:
+            requests: User request strings
+            
+        Returns:
+            List of AgentResponse, in the order of ``requests``
+        """
+        responses: List[Optional[AgentResponse]] = [None] * len(requests)
+        pending = []
+        for i, request in enumerate(requests):
+            # Bare help requests don't need the parser
+            if is_help_request(request):
+                responses[i] = AgentResponse(success=True, message=_HELP_MSG)
+            else:
+                pending.append(i)
+
+        if pending:
+            try:
+                # The parser blocks on the LLM; keep it off the event loop
+                commands = await asyncio.to_thread(
+                    self.command_parser.parse_requests, [requests[i] for i in pending]
+                )
+            except Exception as e:
+                logger.error(f"Error handling request batch: {str(e)}", exc_info=True)
+                error = AgentResponse(success=False, message=str(e), error=str(e))
+                for i in pending:
+                    responses[i] = error
+                return responses
+
+            # Address -> (index, command) in request order; commands without an
+            # address share one group
+            groups: Dict[Optional[str], List[Tuple[int, Any]]] = {}
+            for i, command in zip(pending, commands):
+                if isinstance(command, InformationalCommand) and command.topic == "help":
+                    responses[i] = AgentResponse(success=True, message=_HELP_MSG)
+                else:
+                    address = getattr(command, "address", None)
+                    if address is not None:
+                        address = address.lower()
+                    groups.setdefault(address, []).append((i, command))
+
+            async def run_group(group: List[Tuple[int, Any]]) -> None:
+                for i, command in group:
+                    responses[i] = await self.execute_command(command)
+
+            await asyncio.gather(*(run_group(group) for group in groups.values()))
+        return responses
+
     async def execute_command(self, command) -> AgentResponse:
         """Execute a parsed command.
         
@@ -351,80 +447,58 @@ Just ask me what you'd like to do!"""
         Returns:
             AgentResponse: Response with success status and message
         """
+        handler = self._dispatch.get(type(command))
+        if handler is None:
+            return AgentResponse(
+                success=False,
+                message=f"Unknown command type: {type(command)}",
+                error="Invalid command type"
+            )
         try:
-            if isinstance(command, StakeCommand):
-                # Validate stake amount
-                if command.amount <= 0:
-                    return AgentResponse(
-                        success=False,
-                        message="Stake amount must be greater than 0 ETH",
-                        error="Invalid stake amount"
-                    )
-                
-                # Use default address if 'user' is provided
-                address = "0xdefault" if command.address == "user" else command.address
-                
-                # Execute stake
-                result = await self.operations.stake(address, command.amount, command.validator)
-                if isinstance(result, dict) and "status" in result:
-                    msg = f"Successfully staked {result['value']} from {result['from']} (Transaction: {result['hash']})"
-                    return AgentResponse(success=True, message=msg)
-                return AgentResponse(success=True, message=result)
-                
-            elif isinstance(command, UnstakeCommand):
-                # Use default address if 'user' is provided
-                address = "0xdefault" if command.address == "user" else command.address
-                
-                # Execute unstake
-                result = await self.operations.unstake(address, command.amount)
-                if isinstance(result, dict) and "status" in result:
-                    msg = f"Successfully unstaked {result['value']} from {result['from']} (Transaction: {result['hash']})"
-                    return AgentResponse(success=True, message=msg)
-                return AgentResponse(success=True, message=result)
-                
-            elif isinstance(command, CompoundCommand):
-                # Use default address if 'user' is provided
-                address = "0xdefault" if command.address == "user" else command.address
-                
-                # Execute compound
-                result = await self.operations.compound(address)
-                if isinstance(result, dict) and "status" in result:
-                    msg = f"Successfully compounded rewards for {result['from']} (Transaction: {result['hash']})"
-                    return AgentResponse(success=True, message=msg)
-                return AgentResponse(success=True, message=result)
-                
-            elif isinstance(command, ViewCommand):
-                # Use default address if 'user' is provided
-                address = "0xdefault" if command.address == "user" else command.address
-                
-                # Get view result
-                result = await self.operations.view(address, command.view_type)
-                return AgentResponse(success=True, message=result)
-                
-            elif isinstance(command, InformationalCommand):
-                # Handle info request
-                if command.topic == "help":
-                    # Return a more detailed help message
-                    help_msg = """I can help you with:
-
-- Staking and unstaking tokens
-- Viewing your staking position
-- Monitoring APR changes
-- Compounding rewards
-- Optimizing your returns
-
-Just ask me what you'd like to do!"""
-                    return AgentResponse(success=True, message=help_msg)
-                else:
-                    return AgentResponse(success=True, message=self.character.format_response(command.topic))
-                
-            else:
-                return AgentResponse(
-                    success=False,
-                    message=f"Unknown command type: {type(command)}",
-                    error="Invalid command type"
-                )
-                
+            return await handler(command)
         except Exception as e:
             logger.error(f"Error executing command: {str(e)}")
             return AgentResponse(success=False, message=str(e), error=str(e))
+
+    async def _exec_stake(self, command: StakeCommand) -> AgentResponse:
+        # Validate stake amount
+        if command.amount <= 0:
+            return AgentResponse(
+                success=False,
+                message="Stake amount must be greater than 0 ETH",
+                error="Invalid stake amount"
+            )
+        
+        # Execute stake
+        result = await self.operations.stake(command.address, command.amount, command.validator)
+        if isinstance(result, dict) and "status" in result:
+            msg = f"Successfully staked {result['value']} from {result['from']} (Transaction: {result['hash']})"
+            return AgentResponse(success=True, message=msg)
+        return AgentResponse(success=True, message=result)
+
+    async def _exec_unstake(self, command: UnstakeCommand) -> AgentResponse:
+        # Execute unstake
+        result = await self.operations.unstake(command.address, command.amount)
+        if isinstance(result, dict) and "status" in result:
+            msg = f"Successfully unstaked {result['value']} from {result['from']} (Transaction: {result['hash']})"
+            return AgentResponse(success=True, message=msg)
+        return AgentResponse(success=True, message=result)
+
+    async def _exec_compound(self, command: CompoundCommand) -> AgentResponse:
+        # Execute compound
+        result = await self.operations.compound(command.address)
+        if isinstance(result, dict) and "status" in result:
+            msg = f"Successfully compounded rewards for {result['from']} (Transaction: {result['hash']})"
+            return AgentResponse(success=True, message=msg)
+        return AgentResponse(success=True, message=result)
+
+    async def _exec_view(self, command: ViewCommand) -> AgentResponse:
+        # Get view result
+        result = await self.operations.view(command.address, command.view_type)
+        return AgentResponse(success=True, message=result)
+
+    async def _exec_info(self, command: InformationalCommand) -> AgentResponse:
+        # Handle info request
+        if command.topic == "help":
+            return AgentResponse(success=True, message=_HELP_MSG)
+        return AgentResponse(success=True, message=self.character.format_response(command.topic))
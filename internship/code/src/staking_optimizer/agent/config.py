@@ -1,5 +1,7 @@
 """StakingOptimizer agent configuration."""
 
+import functools
+
 from langchain.prompts import PromptTemplate
 from langchain.tools import Tool
 from langchain.agents import AgentType, initialize_agent
@@ -10,6 +12,28 @@ from ..operations.staking import StakingOperations
 from ..safety.validator import TransactionValidator
 from ..autocompound.scheduler import AutoCompoundScheduler
 
+# Profile fields used by the agent prompt, bound once at import
+_NAME = STAKE_MATE_PROFILE['name']
+_PERSONALITY = STAKE_MATE_PROFILE['personality']
+_EXPERTISE_STR = ', '.join(STAKE_MATE_PROFILE['expertise'])
+_STYLE_STR = '\n'.join('- ' + style for style in STAKE_MATE_PROFILE['communication_style'])
+
+# Agent prompt rendered from the static character profile
+_AGENT_PROMPT = f"""You are {_NAME}, {_PERSONALITY}.
+
+Your expertise includes: {_EXPERTISE_STR}
+
+When communicating, you should:
+{_STYLE_STR}
+
+Please respond with the following format:
+"Action: [action name]
+Parameters: [parameter values]
+Reasoning: [explanation of the action]"
+
+You can ask for help or clarification by responding with "Help" or "Clarify".
+"""
+
 def create_staking_tools(
     staking_ops: StakingOperations,
     validator: TransactionValidator,
@@ -49,22 +73,13 @@ def create_staking_tools(
         ),
     ]
 
+@functools.cache
 def create_agent_prompt() -> PromptTemplate:
-    """Create the agent's prompt template."""
-    template = f"""You are {STAKE_MATE_PROFILE['name']}, {STAKE_MATE_PROFILE['personality']}.
-
-Your expertise includes: {', '.join(STAKE_MATE_PROFILE['expertise'])}
-
-When communicating, you should:
-{chr(10).join('- ' + style for style in STAKE_MATE_PROFILE['communication_style'])}
-
-Please respond with the following format:
-"Action: [action name]
-Parameters: [parameter values]
-Reasoning: [explanation of the action]"
-
-You can ask for help or clarification by responding with "Help" or "Clarify".
-"""
+    """Create the agent's prompt template.
+    
+    The profile is static, so the template is built once and shared.
+    """
+    return PromptTemplate.from_template(_AGENT_PROMPT)
 
 def initialize_staking_agent(llm: BaseLLM, tools: list[Tool], prompt: PromptTemplate) -> AgentType:
     """Initialize the staking agent."""
@@ -1,10 +1,12 @@
 """Response models for agent operations."""
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AgentResponse(BaseModel):
     """Response from agent operations."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
     error: Optional[str] = None
@@ -1,22 +1,26 @@
 """Tools for StakeMate agent."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from langchain_core.tools import BaseTool, StructuredTool
 
 
 class NoInput(BaseModel):
     """No input parameters."""
-    pass
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class AddressInput(BaseModel):
     """Input for address-based tools."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     address: str = Field(description="Ethereum address")
 
 
 class StakeArgs(BaseModel):
     """Input for staking tools."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     address: str = Field(description="Ethereum address")
     amount: float = Field(description="Amount to stake in ETH")
 
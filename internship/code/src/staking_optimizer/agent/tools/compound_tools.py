@@ -1,5 +1,7 @@
 """Tools for auto-compounding operations."""
-from typing import Dict, List, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Union
 from decimal import Decimal
 from datetime import timedelta
 
@@ -13,6 +15,7 @@ from ...autocompound import (
     TimeBasedStrategy,
     GasOptimizer
 )
+from .staking_tools import _as_args
 
 
 class CompoundArgs(BaseModel):
@@ -22,15 +25,75 @@ class CompoundArgs(BaseModel):
     max_gas_price: Optional[int] = Field(None, description="Maximum gas price to allow for compounding")
 
 
+@functools.lru_cache(maxsize=256)
+def _compound_status(rewards: Decimal, can_compound: bool) -> Mapping[str, str]:
+    """Status payload for a rewards amount.
+
+    Shared between calls, so it is cached as a read-only view; callers get a
+    copy from ``check_status``.
+    """
+    return MappingProxyType({
+        "rewards": f"{float(rewards):.6f} ETH",
+        "can_compound": "true" if can_compound else "false",
+    })
+
+
+class _CompoundHandlers:
+    """Tool callables bound to one monitor, blockchain and contract."""
+    __slots__ = ("monitor", "blockchain", "contract", "trusted_args")
+
+    def __init__(
+        self,
+        monitor: AutoCompoundMonitor,
+        blockchain: MockBlockchainState,
+        contract: MockStakingContract,
+        trusted_args: bool = False,
+    ):
+        self.monitor = monitor
+        self.blockchain = blockchain
+        self.contract = contract
+        self.trusted_args = trusted_args
+
+    def check_status(self, address: str) -> Dict[str, str]:
+        return dict(_compound_status(
+            self.monitor.contract.rewards[address],
+            bool(self.monitor.check_rewards(address)),
+        ))
+
+    def execute(self, args: Union[CompoundArgs, Dict]) -> Dict[str, str]:
+        args = _as_args(CompoundArgs, args, self.trusted_args)
+        result = self.monitor.execute_compound(
+            address=args.address,
+            blockchain=self.blockchain,
+            contract=self.contract,
+            min_rewards=args.min_rewards,
+            max_gas_price=args.max_gas_price,
+        )
+        return {
+            "status": "success" if result is not None else "failed",
+            "value": result["value"] if result and "value" in result else "0.000000 ETH",
+        }
+
+    def get_stats(self, address: str) -> Dict:
+        history = self.monitor.compound_history
+        return {
+            **self.monitor.get_compound_stats(address),
+            "last_compound": history[-1].timestamp.isoformat() if history else None,
+        }
+
+
 def create_compound_tools(
     blockchain: MockBlockchainState,
     contract: MockStakingContract,
+    trusted_args: bool = False,
 ) -> List[BaseTool]:
     """Create tools for auto-compounding operations.
     
     Args:
         blockchain: Mock blockchain state
         contract: Mock staking contract
+        trusted_args: Build argument models from dicts without validation,
+            for internal callers that pass already-validated values
         
     Returns:
         List of LangChain tools for auto-compounding
@@ -53,6 +116,7 @@ def create_compound_tools(
         contract=contract,
     )
 
+    handlers = _CompoundHandlers(monitor, blockchain, contract, trusted_args)
     tools = []
 
     # Check compound status
@@ -60,10 +124,7 @@ def create_compound_tools(
         Tool(
             name="check_compound_status",
             description="Check if rewards should be compounded based on current conditions",
-            func=lambda address: {
-                "rewards": f"{float(monitor.contract.rewards[address]):.6f} ETH",
-                "can_compound": str(monitor.check_rewards(address)).lower(),
-            },
+            func=handlers.check_status,
         )
     )
 
@@ -73,16 +134,7 @@ def create_compound_tools(
             name="execute_compound",
             description="Execute compound operation for an address",
             args_schema=CompoundArgs,
-            func=lambda args: {
-                "status": "success" if (result := monitor.execute_compound(
-                    address=args.address,
-                    blockchain=blockchain,
-                    contract=contract,
-                    min_rewards=args.min_rewards,
-                    max_gas_price=args.max_gas_price,
-                )) is not None else "failed",
-                "value": result["value"] if result and "value" in result else "0.000000 ETH",
-            },
+            func=handlers.execute,
         )
     )
 
@@ -91,14 +143,7 @@ def create_compound_tools(
         Tool(
             name="get_compound_stats",
             description="Get statistics about past compound operations",
-            func=lambda address: {
-                **monitor.get_compound_stats(address),
-                "last_compound": (
-                    monitor.compound_history[-1].timestamp.isoformat()
-                    if monitor.compound_history
-                    else None
-                ),
-            },
+            func=handlers.get_stats,
         )
     )
 
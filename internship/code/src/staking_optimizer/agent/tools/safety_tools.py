@@ -1,5 +1,6 @@
 """Tools for validating request safety."""
-from typing import Dict, List, Literal
+import functools
+from typing import Dict, List, Literal, Tuple
 
 from langchain.tools import BaseTool
 
@@ -42,10 +43,16 @@ class ValidateRequestTool(BaseTool):
         """
         super().__init__()
         self._validator = validator
+        # Recurring requests skip the pattern and keyword scans; keyed on the
+        # rules version too, so adding a pattern or keyword invalidates it
+        self._cached_validate = functools.lru_cache(maxsize=512)(self._validate)
+
+    def _validate(self, request: str, rules_version: int) -> Tuple[bool, str]:
+        return self._validator.validate_request(request)
         
     def _run(self, request: str) -> Dict[str, str]:
         """Run the validation."""
-        is_valid, reason = self._validator.validate_request(request)
+        is_valid, reason = self._cached_validate(request, self._validator.rules_version)
         return {
             "is_safe": is_valid,
             "message": reason
@@ -1,20 +1,22 @@
 """Tools for staking operations."""
+import logging
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Type, TypeVar, Union
 
 from langchain_core.tools import BaseTool, StructuredTool, Tool
 from pydantic import BaseModel, Field
 
 from ...blockchain import MockBlockchainState, MockStakingContract
 from ...operations import (
-    get_staking_position_mock,
     stake_tokens,
     unstake_tokens,
     claim_rewards,
-    format_position,
+    format_position_direct,
 )
 from ...utils import format_transaction
 
+logger = logging.getLogger(__name__)
+
 
 class StakeArgs(BaseModel):
     """Arguments for staking tokens."""
@@ -38,19 +40,109 @@ class ViewArgs(BaseModel):
     address: str = Field(..., description="The address to view staking position for")
 
 
+ArgsT = TypeVar("ArgsT", bound=BaseModel)
+
+
+def _as_args(schema: Type[ArgsT], args: Union[ArgsT, Dict], trusted: bool) -> ArgsT:
+    """Get tool arguments as a ``schema`` instance.
+    
+    Dicts from trusted internal callers, whose values are already validated,
+    skip pydantic validation via ``model_construct``.
+    """
+    if isinstance(args, dict):
+        return schema.model_construct(**args) if trusted else schema(**args)
+    return args
+
+
+class _StakingHandlers:
+    """Tool callables bound to one blockchain and contract.
+
+    Bound methods of a single instance replace per-tool closures, so each
+    call reads its state from slots instead of closure cells.
+    """
+    __slots__ = ("blockchain", "contract", "trusted_args", "_apr_display", "_gas_display")
+
+    def __init__(
+        self,
+        blockchain: MockBlockchainState,
+        contract: MockStakingContract,
+        trusted_args: bool = False,
+    ):
+        self.blockchain = blockchain
+        self.contract = contract
+        self.trusted_args = trusted_args
+        # (last value read, its display string); polled values rarely change
+        self._apr_display = (None, "")
+        self._gas_display = (None, "")
+
+    def view(self, args: Union[ViewArgs, Dict]) -> Dict:
+        args = _as_args(ViewArgs, args, self.trusted_args)
+        return format_position_direct(args.address, self.blockchain, self.contract)
+
+    def get_apr(self, _) -> str:
+        # Accept string input, format to 2 decimal places
+        apr = self.contract.apr
+        cached = self._apr_display
+        if cached[0] != apr:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw APR: %r (%s)", apr, type(apr).__name__)
+            basis_points = round(apr * 10000)
+            # Split the magnitude, since floor division rounds negatives down
+            sign = "-" if basis_points < 0 else ""
+            whole, frac = divmod(abs(basis_points), 100)
+            cached = self._apr_display = (apr, f"{sign}{whole}.{frac:02d}%")
+        return cached[1]
+
+    def get_gas_price(self, _) -> str:
+        # Convert wei to gwei, rounded to 0.1 gwei in integer math
+        gas_price = self.blockchain.gas_price
+        cached = self._gas_display
+        if cached[0] != gas_price:
+            tenths = (int(gas_price) + 5 * 10**7) // 10**8
+            cached = self._gas_display = (
+                gas_price, f"{tenths // 10}.{tenths % 10} gwei"
+            )
+        return cached[1]
+
+    def get_balance(self, address: str) -> str:
+        return f"{float(self.blockchain.get_balance(address)):.1f} ETH"
+
+    def stake(self, args: Union[StakeArgs, Dict]) -> Dict:
+        args = _as_args(StakeArgs, args, self.trusted_args)
+        return format_transaction(
+            stake_tokens(args.address, args.amount, self.blockchain, contract=self.contract)
+        )
+
+    def unstake(self, args: Union[UnstakeArgs, Dict]) -> Dict:
+        args = _as_args(UnstakeArgs, args, self.trusted_args)
+        return format_transaction(
+            unstake_tokens(args.address, args.amount, self.blockchain, contract=self.contract)
+        )
+
+    def claim(self, args: Union[ClaimArgs, Dict]) -> Dict:
+        args = _as_args(ClaimArgs, args, self.trusted_args)
+        return format_transaction(
+            claim_rewards(args.address, self.blockchain, contract=self.contract)
+        )
+
+
 def create_staking_tools(
     blockchain: MockBlockchainState,
     contract: MockStakingContract,
+    trusted_args: bool = False,
 ) -> List[BaseTool]:
     """Create tools for staking operations.
     
     Args:
         blockchain: Mock blockchain state
         contract: Mock staking contract
+        trusted_args: Build argument models from dicts without validation,
+            for internal callers that pass already-validated values
         
     Returns:
         List of LangChain tools for staking operations
     """
+    handlers = _StakingHandlers(blockchain, contract, trusted_args)
     tools = []
 
     # View staking position
@@ -58,9 +150,7 @@ def create_staking_tools(
         Tool(
             name="view_staking_position",
             description="View current staking position including balance, staked amount, rewards, and APR",
-            func=lambda args: format_position(
-                get_staking_position_mock(args.address, blockchain, contract)
-            ),
+            func=handlers.view,
             args_schema=ViewArgs,
         )
     )
@@ -70,10 +160,7 @@ def create_staking_tools(
         Tool(
             name="GetStakingAPR",
             description="Get the current staking APR. Returns APR as a percentage with 2 decimal places (e.g. '5.00%'). Input can be any string.",
-            func=lambda _: (
-                print(f"Raw APR: {contract.apr}, Type: {type(contract.apr)}, After multiply: {contract.apr * 100}") or
-                f"{contract.apr * 100:.2f}%"
-            ),  # Accept string input, format to 2 decimal places
+            func=handlers.get_apr,
         )
     )
 
@@ -82,7 +169,7 @@ def create_staking_tools(
         Tool(
             name="GetGasPrice",
             description="Get the current gas price in gwei",
-            func=lambda _: f"{float(blockchain.gas_price) / 1e9:.1f} gwei",  # Convert wei to gwei
+            func=handlers.get_gas_price,
         )
     )
 
@@ -91,33 +178,21 @@ def create_staking_tools(
         Tool(
             name="GetAccountBalance",
             description="Get the balance of an Ethereum address",
-            func=lambda address: f"{float(blockchain.get_balance(address)):.1f} ETH",
+            func=handlers.get_balance,
         )
     )
 
     # Stake tokens
-    tools.append(
-        StructuredTool(
-            name="stake_tokens",
-            description="Stake ETH tokens to earn rewards",
-            args_schema=StakeArgs,
-            func=lambda args: format_transaction(
-                stake_tokens(args.address, args.amount, blockchain, contract=contract)
-            ),
-        )
+    stake_tool = StructuredTool(
+        name="stake_tokens",
+        description="Stake ETH tokens to earn rewards",
+        args_schema=StakeArgs,
+        func=handlers.stake,
     )
+    tools.append(stake_tool)
 
-    # Stake tokens (alias)
-    tools.append(
-        StructuredTool(
-            name="Stake",
-            description="Stake ETH tokens to earn rewards",
-            args_schema=StakeArgs,
-            func=lambda args: format_transaction(
-                stake_tokens(args.address, args.amount, blockchain, contract=contract)
-            ),
-        )
-    )
+    # Stake tokens (alias); a shallow copy shares the callable and schema
+    tools.append(stake_tool.model_copy(update={"name": "Stake"}))
 
     # Unstake tokens
     tools.append(
@@ -125,9 +200,7 @@ def create_staking_tools(
             name="unstake_tokens",
             description="Unstake tokens and return them to your wallet",
             args_schema=UnstakeArgs,
-            func=lambda args: format_transaction(
-                unstake_tokens(args.address, args.amount, blockchain, contract=contract)
-            ),
+            func=handlers.unstake,
         )
     )
 
@@ -137,9 +210,7 @@ def create_staking_tools(
             name="claim_rewards",
             description="Claim earned staking rewards",
             args_schema=ClaimArgs,
-            func=lambda args: format_transaction(
-                claim_rewards(args.address, blockchain, contract=contract)
-            ),
+            func=handlers.claim,
         )
     )
 
@@ -2,6 +2,7 @@
 from .error_handler import ErrorResponse, handle_tool_error
 from .state import (
     ConversationState,
+    ConversationStore,
     get_conversation_history,
     add_human_message,
     add_ai_message,
@@ -13,6 +14,7 @@ __all__ = [
     "ErrorResponse",
     "handle_tool_error",
     "ConversationState",
+    "ConversationStore",
     "get_conversation_history",
     "add_human_message",
     "add_ai_message",
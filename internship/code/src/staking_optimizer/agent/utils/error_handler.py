@@ -1,4 +1,5 @@
 """Error handling utilities for the StakingOptimizer agent."""
+import functools
 import logging
 from typing import Any, Dict, Optional
 
@@ -14,6 +15,25 @@ class ErrorResponse(BaseModel):
     suggestion: Optional[str] = None
 
 
+# Responses for each error kind with the constant fields bound. The fields
+# are known to be valid, so model_construct skips validation.
+_invalid_input = functools.partial(
+    ErrorResponse.model_construct,
+    error="Invalid Input",
+    suggestion="Please check your input values and try again",
+)
+_not_found = functools.partial(
+    ErrorResponse.model_construct,
+    error="Not Found",
+    suggestion="The requested resource was not found",
+)
+_internal_error = functools.partial(
+    ErrorResponse.model_construct,
+    error="Internal Error",
+    suggestion="An unexpected error occurred. Please try again later",
+)
+
+
 def handle_tool_error(error: Exception, context: Optional[Dict[str, Any]] = None) -> ErrorResponse:
     """Handle errors from tool execution.
     
@@ -31,21 +51,10 @@ def handle_tool_error(error: Exception, context: Optional[Dict[str, Any]] = None
     logger.error(f"Tool error: {error_type} - {error_msg}", exc_info=True)
     
     # Handle specific error types
+    details = {"message": error_msg, "context": context}
     if isinstance(error, ValueError):
-        return ErrorResponse(
-            error="Invalid Input",
-            details={"message": error_msg, "context": context},
-            suggestion="Please check your input values and try again"
-        )
+        return _invalid_input(details=details)
     elif isinstance(error, KeyError):
-        return ErrorResponse(
-            error="Not Found",
-            details={"message": error_msg, "context": context},
-            suggestion="The requested resource was not found"
-        )
+        return _not_found(details=details)
     else:
-        return ErrorResponse(
-            error="Internal Error",
-            details={"message": error_msg, "context": context},
-            suggestion="An unexpected error occurred. Please try again later"
-        )
+        return _internal_error(details=details)
@@ -1,16 +1,89 @@
 """State management utilities for the StakingOptimizer agent."""
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 
 
-class ConversationState(BaseModel):
-    """State of a conversation with the agent."""
-    thread_id: str = Field(..., description="Unique identifier for the conversation thread")
-    messages: List[Dict[str, str]] = Field(default_factory=list, description="List of conversation messages")
-    context: Dict[str, str] = Field(default_factory=dict, description="Additional context for the conversation")
-    last_tool_result: Optional[Dict[str, str]] = Field(None, description="Result of the last tool execution")
+# Default history window: the most recent messages kept, and the estimated
+# token budget they may use
+DEFAULT_MAX_MESSAGES = 20
+DEFAULT_MAX_TOKENS = 4000
+
+# ConversationStore defaults: lock shards, and conversations kept per shard
+DEFAULT_STORE_SHARDS = 16
+DEFAULT_SHARD_SIZE = 1000
+
+
+@dataclass(slots=True)
+class ConversationState:
+    """State of a conversation with the agent.
+    
+    History is a sliding window: once it exceeds ``max_messages`` messages or
+    ``max_tokens`` estimated tokens, the oldest messages are dropped.
+    
+    Attributes:
+        thread_id: Unique identifier for the conversation thread
+        messages: List of conversation messages
+        context: Additional context for the conversation
+        last_tool_result: Result of the last tool execution
+        max_messages: Maximum number of messages kept in history
+        max_tokens: Estimated token budget for the kept history
+        token_count: Estimated tokens in the kept history
+    """
+    thread_id: str
+    messages: List[Dict[str, str]] = field(default_factory=list)
+    context: Dict[str, str] = field(default_factory=dict)
+    last_tool_result: Optional[Dict[str, str]] = None
+    max_messages: int = DEFAULT_MAX_MESSAGES
+    max_tokens: int = DEFAULT_MAX_TOKENS
+    token_count: int = 0
+    # LangChain wrappers for ``messages``, built as messages are added so
+    # get_messages_for_llm doesn't rebuild the whole history every turn
+    _llm_messages: List[BaseMessage] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+
+def _estimate_tokens(content: str) -> int:
+    """Cheap token estimate of roughly four characters per token."""
+    return len(content) // 4
+
+
+# Message classes for the roles sent to the LLM
+_ROLE_CTORS = {"user": HumanMessage, "assistant": AIMessage}
+
+
+def _to_llm_messages(messages: List[Dict[str, str]]) -> List[BaseMessage]:
+    # One dict lookup per message picks the class and skips other roles
+    return [
+        ctor(content=msg["content"])
+        for msg in messages
+        if (ctor := _ROLE_CTORS.get(msg["role"])) is not None
+    ]
+
+
+def _append_message(state: ConversationState, role: str, content: str) -> None:
+    """Append a message, then drop the oldest ones that fall outside the window."""
+    messages = state.messages
+    llm_messages = state._llm_messages
+    if len(llm_messages) != len(messages):
+        # messages was changed directly; resync before appending
+        llm_messages[:] = _to_llm_messages(messages)
+    messages.append({
+        "role": role,
+        "content": content
+    })
+    llm_messages.append(_ROLE_CTORS[role](content=content))
+    state.token_count += _estimate_tokens(content)
+    # Always keep the newest message, even if it alone exceeds the budget
+    while len(messages) > 1 and (
+        len(messages) > state.max_messages or state.token_count > state.max_tokens
+    ):
+        state.token_count -= _estimate_tokens(messages.pop(0)["content"])
+        del llm_messages[0]
 
 
 def get_conversation_history(state: ConversationState) -> List[Dict[str, str]]:
@@ -32,10 +105,7 @@ def add_human_message(state: ConversationState, content: str) -> None:
         state: Current conversation state
         content: Message content
     """
-    state.messages.append({
-        "role": "user",
-        "content": content
-    })
+    _append_message(state, "user", content)
 
 
 def add_ai_message(state: ConversationState, content: str) -> None:
@@ -45,10 +115,7 @@ def add_ai_message(state: ConversationState, content: str) -> None:
         state: Current conversation state
         content: Message content
     """
-    state.messages.append({
-        "role": "assistant",
-        "content": content
-    })
+    _append_message(state, "assistant", content)
 
 
 def add_tool_result(state: ConversationState, result: Dict[str, str]) -> None:
@@ -70,10 +137,81 @@ def get_messages_for_llm(state: ConversationState) -> List[HumanMessage | AIMess
     Returns:
         List of LangChain message objects
     """
-    llm_messages = []
-    for msg in state.messages:
-        if msg["role"] == "user":
-            llm_messages.append(HumanMessage(content=msg["content"]))
-        elif msg["role"] == "assistant":
-            llm_messages.append(AIMessage(content=msg["content"]))
-    return llm_messages
+    llm_messages = state._llm_messages
+    if len(llm_messages) != len(state.messages):
+        # messages was changed directly, or holds other roles
+        return _to_llm_messages(state.messages)
+    return list(llm_messages)
+
+
+class ConversationStore:
+    """Thread-safe store of conversation states by thread ID.
+    
+    Conversations are spread over ``shards`` shards by thread ID hash. Each
+    shard has its own lock, so threads working on different conversations
+    rarely wait on each other, and is a bounded LRU: once it holds
+    ``shard_size`` conversations, the least recently used one is dropped.
+    """
+
+    def __init__(self, shards: int = DEFAULT_STORE_SHARDS, shard_size: int = DEFAULT_SHARD_SIZE):
+        """Initialize the store.
+        
+        Args:
+            shards: Number of independently locked shards
+            shard_size: Most conversations kept per shard
+        """
+        self.shard_size = shard_size
+        self._shards: List[Tuple[Lock, "OrderedDict[str, ConversationState]"]] = [
+            (Lock(), OrderedDict()) for _ in range(shards)
+        ]
+
+    def _shard(self, thread_id: str) -> Tuple[Lock, "OrderedDict[str, ConversationState]"]:
+        return self._shards[hash(thread_id) % len(self._shards)]
+
+    def get(self, thread_id: str) -> ConversationState:
+        """Get the state for a conversation, creating it if needed.
+        
+        Args:
+            thread_id: Conversation thread ID
+            
+        Returns:
+            The conversation's state
+        """
+        lock, states = self._shard(thread_id)
+        with lock:
+            state = states.get(thread_id)
+            if state is not None:
+                states.move_to_end(thread_id)
+                return state
+            state = states[thread_id] = ConversationState(thread_id=thread_id)
+            if len(states) > self.shard_size:
+                states.popitem(last=False)
+            return state
+
+    def discard(self, thread_id: str) -> None:
+        """Forget a conversation, if it is stored.
+        
+        Args:
+            thread_id: Conversation thread ID
+        """
+        lock, states = self._shard(thread_id)
+        with lock:
+            states.pop(thread_id, None)
+
+    def __contains__(self, thread_id: str) -> bool:
+        lock, states = self._shard(thread_id)
+        with lock:
+            return thread_id in states
+
+    def __len__(self) -> int:
+        """Number of stored conversations.
+        
+        Shards are counted one at a time under their own locks, so with
+        concurrent writers the total is a sum of per-shard snapshots rather
+        than one consistent count.
+        """
+        total = 0
+        for lock, states in self._shards:
+            with lock:
+                total += len(states)
+        return total
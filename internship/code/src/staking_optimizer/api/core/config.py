@@ -6,9 +6,11 @@ environment variables, logging setup, and other settings.
 
 import logging
 import os
-from functools import lru_cache
+from functools import cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
 class Settings(BaseSettings):
     """API settings loaded from environment variables.
     
@@ -36,10 +38,12 @@ class Settings(BaseSettings):
         extra="allow"  # Allow extra fields from environment
     )
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance.
     
+    Unbounded cache: the single instance needs no LRU bookkeeping.
+    
     Returns:
         Settings object with configuration values.
     """
@@ -58,6 +62,4 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # Create logger for this module
-    logger = logging.getLogger(__name__)
     logger.info(f"Logging configured at {settings.logging_level} level")
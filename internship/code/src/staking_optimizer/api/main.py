@@ -3,13 +3,18 @@
 This module sets up the FastAPI application and defines the API endpoints.
 """
 
+import httpx
+import orjson
 from fastapi import FastAPI, Request, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, ValidationError as PydanticValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import ValidationError as PydanticValidationError
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Union
 
-from staking_optimizer.api.core.config import Settings, get_settings
+from staking_optimizer.api.core.config import get_settings
 from staking_optimizer.api.core.errors import ValidationError, APIError
+from staking_optimizer.api.models.chat import ChatRequest, ChatResponse
 from staking_optimizer.api.services.chat import ChatService
 from staking_optimizer.blockchain import MockBlockchainState, MockStakingContract
 import logging
@@ -18,11 +23,52 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the HTTP clients shared by all LLM calls
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the app's services before it serves requests, and close them after.
+    
+    Everything is stored on ``app.state``: the settings, one pooled HTTP
+    client pair shared by all LLM calls, the mock blockchain and contract,
+    and the chat service, which coalesces concurrent messages into batched
+    agent calls.
+    """
+    settings = app.state.settings = get_settings()
+    if not settings.OPENAI_API_KEY:  # use an openrouter key instead
+        raise ValueError("OPENAI_API_KEY is required")
+
+    app.state.http_client = httpx.Client(limits=_HTTP_LIMITS)
+    app.state.http_async_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+    try:
+        app.state.mock_blockchain = MockBlockchainState()
+        app.state.mock_contract = MockStakingContract(app.state.mock_blockchain)
+        chat_service = app.state.chat_service = ChatService(
+            app.state.mock_blockchain,
+            app.state.mock_contract,
+            http_client=app.state.http_client,
+            http_async_client=app.state.http_async_client,
+        )
+        logger.info("Chat service initialized successfully")
+        chat_service.start_batching()
+
+        logger.info("API started successfully")
+        try:
+            yield
+        finally:
+            await chat_service.stop_batching()
+    finally:
+        await app.state.http_async_client.aclose()
+        app.state.http_client.close()
+
 # Create FastAPI app
 app = FastAPI(
     title="StakingOptimizer API",
     description="API for interacting with the StakingOptimizer agent",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,  # orjson is faster than stdlib json
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -30,43 +76,19 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, replace with specific origins
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-# Request/Response models
-class ChatRequest(BaseModel):
-    message: str
-
-class ChatResponse(BaseModel):
-    message: str
-    success: bool = True
-    error: str | None = None
-    data: dict | None = None
-
-# Store chat service instance
-chat_service: ChatService | None = None
-mock_blockchain = None
-mock_contract = None
-
-def get_chat_service(settings: Settings = Depends(get_settings)) -> ChatService:
-    """Get or create chat service instance."""
-    global chat_service, mock_blockchain, mock_contract
-    if chat_service is None:
-        try:
-            mock_blockchain = MockBlockchainState()
-            mock_contract = MockStakingContract(mock_blockchain)
-            chat_service = ChatService(mock_blockchain, mock_contract)
-            logger.info("Chat service initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize chat service: {e}")
-            raise HTTPException(status_code=500, detail="Failed to initialize chat service")
-    return chat_service
+async def get_chat_service(request: Request) -> ChatService:
+    """Get the chat service created by the app's lifespan."""
+    return request.app.state.chat_service
 
 @app.exception_handler(PydanticValidationError)
 async def validation_error_handler(request: Request, exc: PydanticValidationError):
     """Handle validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"success": False, "error": str(exc)},
     )
@@ -74,49 +96,84 @@ async def validation_error_handler(request: Request, exc: PydanticValidationErro
 @app.exception_handler(HTTPException)
 async def http_error_handler(request: Request, exc: HTTPException):
     """Handle HTTP errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"success": False, "error": exc.detail},
     )
 
-@app.post("/api/v1/chat")
+async def _process_chat(service: ChatService, message: str) -> Dict[str, Any]:
+    """Run a chat message through the service and build its response.
+    
+    Returns a plain dict in the ChatResponse shape, serialized once by the
+    response class instead of being validated again as a response model.
+    """
+    try:
+        logger.info(f"Processing chat message: {message}")
+        result = await service.process_message(message)
+        logger.info("Chat message processed successfully")
+        return {
+            "success": result.success,
+            "message": result.message,
+            "error": result.error,
+            "data": getattr(result, 'data', None),
+        }
+    except Exception as e:
+        logger.error(f"Error processing chat message: {str(e)}")
+        return {
+            "success": False,
+            "message": "An error occurred processing your request",
+            "error": str(e),
+            "data": None,
+        }
+
+async def _chat_events(service: ChatService, message: str) -> AsyncIterator[str]:
+    """Server-sent events for a chat message.
+    
+    A status event goes out at once so the client gets its first bytes while
+    the agent works, followed by the ChatResponse as a single data event.
+    """
+    yield 'event: status\ndata: {"status": "processing"}\n\n'
+    response = await _process_chat(service, message)
+    yield f"data: {orjson.dumps(response).decode()}\n\n"
+
+@app.post("/api/v1/chat", response_model=None, responses={200: {"model": ChatResponse}})
 async def chat(
     request: ChatRequest,
+    http_request: Request,
     service: ChatService = Depends(get_chat_service)
-) -> ChatResponse:
+) -> Union[Dict[str, Any], StreamingResponse]:
     """Process a chat message.
     
+    Clients that accept ``text/event-stream`` get the result as server-sent
+    events; everyone else gets the ChatResponse as JSON.
+    
     Args:
         request: Chat request containing user message
+        http_request: Incoming HTTP request, for content negotiation
         service: Chat service instance
         
     Returns:
-        ChatResponse containing the result
+        ChatResponse fields containing the result, or a stream of events
     """
-    try:
-        logger.info(f"Processing chat message: {request.message}")
-        result = await service.process_message(request.message)
-        logger.info("Chat message processed successfully")
-        return ChatResponse(
-            message=result.message,
-            success=result.success,
-            error=result.error,
-            data=getattr(result, 'data', None)
-        )
-    except Exception as e:
-        logger.error(f"Error processing chat message: {str(e)}")
-        return ChatResponse(
-            message="An error occurred processing your request",
-            success=False,
-            error=str(e)
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _chat_events(service, request.message),
+            media_type="text/event-stream"
         )
+    return await _process_chat(service, request.message)
 
-@app.on_event("startup")
-async def startup():
-    """Initialize services on startup."""
-    global chat_service, mock_blockchain, mock_contract
-    settings = get_settings()
-    if not settings.OPENAI_API_KEY:  # use an openrouter key instead
-        raise ValueError("OPENAI_API_KEY is required")
-            
-    logger.info("API started successfully")
+@app.post("/api/v1/chat/sync", response_model=None, responses={200: {"model": ChatResponse}})
+async def chat_sync(
+    request: ChatRequest,
+    service: ChatService = Depends(get_chat_service)
+) -> Dict[str, Any]:
+    """Process a chat message and return the full result as JSON.
+    
+    Args:
+        request: Chat request containing user message
+        service: Chat service instance
+        
+    Returns:
+        ChatResponse fields containing the result
+    """
+    return await _process_chat(service, request.message)
@@ -8,56 +8,98 @@ Attributes:
     agent: StakingOptimizer agent instance
 """
 
-import os
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, Optional
+import re
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import httpx
 
-from ..core.config import get_settings
 from ...blockchain import MockBlockchainState, MockStakingContract
 from ...agent.base import StakingOptimizerAgent
 from ...agent.models import AgentResponse
 
 logger = logging.getLogger(__name__)
 
+# Micro-batching defaults: the most messages sent to the agent together, and
+# how long the first message of a batch waits for others to join it
+BATCH_SIZE = 8
+BATCH_WAIT_MS = 20
+
+# Written to the default agent config path when no config exists there
+_DEFAULT_CONFIG = """
+# Default StakingOptimizer agent configuration
+model: openai/gpt-4o-2024-11-20
+temperature: 0.7
+max_tokens: 1000
+"""
+
+@functools.cache
+def _default_config_path() -> str:
+    """Resolve the default agent config, creating it if missing.
+    
+    Cached, so the filesystem is only touched once per process.
+    """
+    config_path = Path(__file__).resolve().parents[2] / "config" / "agent_config.yaml"
+    if not config_path.exists():
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text(_DEFAULT_CONFIG)
+    return str(config_path)
+
+# Keywords that mark a message as unsafe, matched anywhere in the text in a
+# single case-insensitive pass
+_UNSAFE_RE = re.compile(r"sudo|rm|delete|remove|drop", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
+def _is_unsafe(message: str) -> bool:
+    """Whether a message contains an unsafe keyword.
+    
+    Cached on the exact text, so retried messages skip the scan.
+    """
+    return _UNSAFE_RE.search(message) is not None
+
 class ChatService:
     """Service for handling chat interactions with the StakingOptimizer agent."""
     
-    def __init__(self, blockchain: MockBlockchainState, contract: Optional[MockStakingContract] = None, config_path: Optional[str] = None):
+    def __init__(
+        self,
+        blockchain: MockBlockchainState,
+        contract: Optional[MockStakingContract] = None,
+        config_path: Optional[str] = None,
+        batch_size: int = BATCH_SIZE,
+        batch_wait_ms: float = BATCH_WAIT_MS,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize chat service.
         
         Args:
             blockchain: Mock blockchain state for the agent
             contract: Optional mock staking contract. If not provided, a new one will be created
-            config_path: Optional path to agent config file. If not provided, a default one will be created
+            config_path: Optional path to agent config file. If not provided, the default one is used (and created if missing)
+            batch_size: Most messages handled by one agent call once batching is started
+            batch_wait_ms: How long a batch waits to fill up, in milliseconds
+            http_client: Optional shared HTTP client for the agent's LLM calls
+            http_async_client: Optional shared async HTTP client for the agent's LLM calls
         """
         self.blockchain = blockchain
         self.contract = contract or MockStakingContract(blockchain)
-        
-        # Get settings for agent initialization
-        settings = get_settings()
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait_ms / 1000
+        # Set by start_batching; until then messages go straight to the agent
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
         
         # Set up agent with required config
         if not config_path:
-            config_path = os.path.join(
-                os.path.dirname(__file__),
-                "..",
-                "..",
-                "config",
-                "agent_config.yaml"
-            )
-            
-            # Ensure config directory exists
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            
-            # Create default config if it doesn't exist
-            if not os.path.exists(config_path):
-                with open(config_path, "w") as f:
-                    f.write("""
-# Default StakingOptimizer agent configuration
-model: openai/gpt-4o-2024-11-20
-temperature: 0.7
-max_tokens: 1000
-""")
+            config_path = _default_config_path()
+        
+        # Create default account if it doesn't exist
+        if "0xdefault" not in blockchain.accounts:
+            blockchain.create_account("0xdefault", float(10))  # Give default account 10 ETH
+            logger.info("Created default account with 10 ETH")
         
         # Initialize agent with mock private key for testing
         self.agent = StakingOptimizerAgent(
@@ -65,13 +107,10 @@ max_tokens: 1000
             rpc_url="http://localhost:8545",  # Local Ethereum node
             config_path=config_path,
             mock_blockchain=blockchain,
-            mock_contract=self.contract
+            mock_contract=self.contract,
+            http_client=http_client,
+            http_async_client=http_async_client,
         )
-        
-        # Create default account if it doesn't exist
-        if "0xdefault" not in blockchain.accounts:
-            blockchain.create_account("0xdefault", float(10))  # Give default account 10 ETH
-            logger.info("Created default account with 10 ETH")
             
         logger.info("Initialized ChatService with StakingOptimizer agent")
 
@@ -86,7 +125,7 @@ max_tokens: 1000
         """
         try:
             # Check for unsafe requests
-            if any(unsafe in message.lower() for unsafe in ['sudo', 'rm', 'delete', 'remove', 'drop']):
+            if _is_unsafe(message):
                 return AgentResponse(
                     success=False,
                     message="I cannot process potentially unsafe requests.",
@@ -94,7 +133,11 @@ max_tokens: 1000
                 )
             
             # Process message
-            return await self.agent.handle_request(message)
+            if self._batcher is None:
+                return await self.agent.handle_request(message)
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put((message, future))
+            return await future
         except Exception as e:
             logger.error(f"Error in agent chat: {str(e)}", exc_info=True)
             return AgentResponse(
@@ -102,3 +145,68 @@ max_tokens: 1000
                 message=str(e),
                 error=str(e)
             )
+
+    def start_batching(self) -> None:
+        """Start coalescing concurrent messages into batched agent calls.
+        
+        Must be called from the event loop that serves process_message.
+        """
+        if self._batcher is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.get_running_loop().create_task(self._run_batcher())
+        logger.info(f"Started message batching (size {self.batch_size}, wait {self.batch_wait * 1000:g}ms)")
+
+    async def stop_batching(self) -> None:
+        """Stop batching; messages still queued are cancelled."""
+        if self._batcher is None:
+            return
+        batcher, self._batcher = self._batcher, None
+        batcher.cancel()
+        try:
+            await batcher
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        self._queue = None
+
+    async def _next_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Wait for a message, then collect more until the batch is full or the wait ends.
+        
+        Fills ``batch`` in place, so if the batcher is cancelled mid-collection
+        the caller still holds the messages already taken off the queue.
+        """
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        batch.append(await queue.get())
+        deadline = loop.time() + self.batch_wait
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run_batcher(self) -> None:
+        """Hand queued messages to the agent in batches and resolve their futures."""
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = []
+            try:
+                await self._next_batch(batch)
+                results = await self.agent.handle_request_batch([message for message, _ in batch])
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -14,6 +14,7 @@ from ..blockchain import MockBlockchainState, MockStakingContract
 from ..operations.stake import stake_tokens
 from ..operations.view import get_staking_position_mock, StakingPosition
 from ..utils import format_transaction
+from ..utils.units import eth_to_wei, wei_to_eth
 from .optimizer import GasOptimizer
 from .strategy import AutoCompoundStrategy, CompoundDecision
 
@@ -27,23 +28,23 @@ class CompoundEvent:
     
     Attributes:
         timestamp: When the compound occurred
-        rewards: Amount of rewards that were compounded
-        gas_price: Gas price at time of compound
-        gas_used: Gas used for the compound transaction
+        rewards: Amount of rewards that were compounded, in wei
+        gas_price: Gas price at time of compound, in wei
+        gas_used: Gas used for the compound transaction, in gas units
         transaction_hash: Hash of the compound transaction
         address: Address that was compounded
     """
     
     timestamp: datetime
-    rewards: Decimal
-    gas_price: Decimal
-    gas_used: Decimal
+    rewards: int
+    gas_price: int
+    gas_used: int
     transaction_hash: str
     address: str
 
     @property
-    def gas_cost(self) -> Decimal:
-        """Calculate total gas cost."""
+    def gas_cost(self) -> int:
+        """Calculate total gas cost in wei."""
         return self.gas_price * self.gas_used
 
 
@@ -70,6 +71,11 @@ class RewardMonitor:
     compound_history: List[CompoundEvent] = field(default_factory=list)
     last_check: Optional[datetime] = None
     gas_optimizer: GasOptimizer = field(init=False)
+    # Running totals per address, in integer wei, kept up to date as
+    # compounds are recorded so reads don't rescan the history
+    _stats_by_addr: Dict[str, Dict[str, int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
     
     def __post_init__(self):
         """Initialize gas optimizer."""
@@ -78,6 +84,26 @@ class RewardMonitor:
             window_size=60,  # Look at last hour
             min_window_size=5,  # Minimum 5 minute window
         )
+        for event in self.compound_history:
+            self._update_stats(event)
+
+    def _update_stats(self, event: CompoundEvent) -> None:
+        """Fold a compound event into its address's running stats."""
+        stats = self._stats_by_addr.get(event.address)
+        if stats is None:
+            stats = self._stats_by_addr[event.address] = {
+                "total_compounds": 0,
+                "total_rewards_compounded": 0,
+                "total_gas_cost": 0,
+            }
+        stats["total_compounds"] += 1
+        stats["total_rewards_compounded"] += event.rewards
+        stats["total_gas_cost"] += event.gas_cost
+
+    def _record_compound(self, event: CompoundEvent) -> None:
+        """Add a compound event to the history and the running stats."""
+        self.compound_history.append(event)
+        self._update_stats(event)
     
     def check_rewards(self, address: Optional[str] = None) -> bool:
         """Check current rewards and decide whether to compound.
@@ -141,26 +167,23 @@ class RewardMonitor:
             check_blockchain = blockchain or self.blockchain
             check_contract = contract or self.contract
 
-            # Get current rewards and convert to Decimal
-            rewards = check_contract.get_rewards(check_address)
-            if not isinstance(rewards, Decimal):
-                rewards = Decimal(str(rewards))
+            # Get current rewards in wei
+            rewards = check_contract.get_rewards_wei(check_address)
 
             # Convert and check minimum rewards
-            if min_rewards is not None:
-                if not isinstance(min_rewards, Decimal):
-                    min_rewards = Decimal(str(min_rewards))
+            if min_rewards is None:
+                min_rewards = self.strategy.min_reward_threshold_wei
             else:
-                min_rewards = self.strategy.min_reward_threshold
+                min_rewards = int(eth_to_wei(min_rewards))
 
             if rewards < min_rewards:
                 logger.info(
-                    f"Insufficient rewards: {float(rewards):.1f} ETH < {float(min_rewards):.1f} ETH"
+                    f"Insufficient rewards: {float(wei_to_eth(rewards)):.1f} ETH < {float(wei_to_eth(min_rewards)):.1f} ETH"
                 )
                 return None
 
             # Check gas price
-            gas_price = check_blockchain.gas_price
+            gas_price = int(check_blockchain.gas_price)
             if max_gas_price is None:
                 max_gas_price = self.strategy.max_gas_price
 
@@ -179,11 +202,11 @@ class RewardMonitor:
                 timestamp=check_blockchain.last_block_time,
                 rewards=rewards,
                 gas_price=gas_price,
-                gas_used=Decimal("100000"),  # Standard gas usage
+                gas_used=100000,  # Standard gas usage
                 transaction_hash=tx_dict["hash"],
                 address=check_address,
             )
-            self.compound_history.append(event)
+            self._record_compound(event)
 
             return tx_dict
 
@@ -215,18 +238,15 @@ class RewardMonitor:
             ValueError: If rewards are insufficient or gas price too high
         """
         try:
-            # Get current rewards and convert to Decimal
-            rewards = contract.get_rewards(address)
-            if not isinstance(rewards, Decimal):
-                rewards = Decimal(str(rewards))
+            # Get current rewards in wei
+            rewards = contract.get_rewards_wei(address)
 
             # Convert and check minimum rewards
             if min_rewards is not None:
-                if not isinstance(min_rewards, Decimal):
-                    min_rewards = Decimal(str(min_rewards))
+                min_rewards = int(eth_to_wei(min_rewards))
                 if rewards < min_rewards:
                     raise ValueError(
-                        f"Insufficient rewards: {float(rewards):.1f} ETH < {float(min_rewards):.1f} ETH"
+                        f"Insufficient rewards: {float(wei_to_eth(rewards)):.1f} ETH < {float(wei_to_eth(min_rewards)):.1f} ETH"
                     )
 
             # Check gas price
@@ -253,30 +273,24 @@ class RewardMonitor:
         Returns:
             Dictionary with:
             - total_compounds: Total number of compounds
-            - total_rewards_compounded: Total rewards compounded
+            - total_rewards_compounded: Total rewards compounded in ETH
             - total_gas_cost: Total gas cost in wei
             - average_gas_cost: Average gas cost per compound
         """
         # Use provided address or fall back to monitor's address
-        stats_address = address or self.address
-        
-        # Filter history for this address
-        history = [e for e in self.compound_history if e.address == stats_address]
-        
-        if not history:
+        stats = self._stats_by_addr.get(address or self.address)
+        if stats is None:
             return {
                 "total_compounds": Decimal("0"),
                 "total_rewards_compounded": Decimal("0"),
                 "total_gas_cost": Decimal("0"),
                 "average_gas_cost": Decimal("0"),
             }
-            
-        total_rewards = sum(e.rewards for e in history)
-        total_gas = sum(e.gas_cost for e in history)
-        
+        # Totals are kept in integer wei; convert only for the caller
+        total_gas = Decimal(stats["total_gas_cost"])
         return {
-            "total_compounds": Decimal(len(history)),
-            "total_rewards_compounded": total_rewards,
+            "total_compounds": Decimal(stats["total_compounds"]),
+            "total_rewards_compounded": wei_to_eth(stats["total_rewards_compounded"]),
             "total_gas_cost": total_gas,
-            "average_gas_cost": total_gas / len(history),
+            "average_gas_cost": total_gas / stats["total_compounds"],
         }
@@ -13,6 +13,7 @@ from typing import Optional
 
 from staking_optimizer.blockchain.mock_state import MockBlockchainState
 from staking_optimizer.operations.view import StakingPosition
+from staking_optimizer.utils.units import WEI_PER_ETH
 
 
 @dataclass
@@ -39,6 +40,17 @@ class AutoCompoundStrategy(ABC):
     must implement. Strategies determine when it's optimal to compound rewards
     based on various factors like gas prices, reward amounts, and time intervals.
     """
+
+    @property
+    def min_reward_threshold(self) -> Decimal:
+        """Minimum reward amount to compound, in ETH."""
+        return self._min_reward_threshold
+
+    @min_reward_threshold.setter
+    def min_reward_threshold(self, threshold: Decimal) -> None:
+        self._min_reward_threshold = threshold
+        # Converted once here so the monitor compares plain ints per check
+        self.min_reward_threshold_wei = int(threshold * WEI_PER_ETH)
     
     @abstractmethod
     def should_compound(
@@ -30,11 +30,15 @@ from logging import getLogger
 from typing import Dict, Optional
 
 from ..types import StakingPosition
+from ..utils.units import WEI_PER_ETH
 from .mock_state import MockBlockchainState
 from .mock_transaction import MockTransaction
 
 logger = getLogger(__name__)
 
+# Assuming 1 block every ~12 seconds = ~2,628,000 blocks per year
+BLOCKS_PER_YEAR = Decimal("2628000")
+
 
 class MockStakingContract:
     """Mock staking contract for testing.
@@ -101,15 +105,12 @@ class MockStakingContract:
         Returns:
             StakingPosition object with current position details
         """
-        staked = self.stakes.get(address, Decimal("0"))
-        rewards = self.get_rewards(address)
-
         return StakingPosition(
             address=address,
-            staked=staked,
-            rewards=rewards,
+            staked=self.stakes.get(address, Decimal("0")),
+            rewards=self.get_rewards(address),
             apr=self.apr,
-            previous_apr=self._previous_apr
+            previous_apr=self._previous_apr,
         )
 
     def get_position(self, address: str) -> StakingPosition:
@@ -251,12 +252,14 @@ class MockStakingContract:
         blocks_passed = self.blockchain.current_block - stake_block
         
         # Calculate rewards: (stake * APR * blocks_passed) / blocks_per_year
-        # Assuming 1 block every ~12 seconds = ~2,628,000 blocks per year
-        blocks_per_year = Decimal("2628000")
-        additional_rewards = (stake * self.apr * blocks_passed) / blocks_per_year
+        additional_rewards = (stake * self.apr * blocks_passed) / BLOCKS_PER_YEAR
         
         return base_rewards + additional_rewards
 
+    def get_rewards_wei(self, address: str) -> int:
+        """Get unclaimed rewards for an address, in wei."""
+        return int(self.get_rewards(address) * WEI_PER_ETH)
+
     def get_apr(self) -> Decimal:
         """Get current Annual Percentage Rate (APR).
 
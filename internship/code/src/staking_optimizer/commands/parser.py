@@ -10,9 +10,10 @@ import os
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
 
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.utils.function_calling import convert_to_openai_function
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, AIMessage
 from langchain_core.callbacks import BaseCallbackHandler
 
 from .models import (
@@ -22,6 +23,70 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Account that the placeholder address "user" resolves to
+_DEFAULT_ADDRESS = "0xdefault"
+
+# Requests answered with help without calling the LLM; shared with the agent
+# through is_help_request so both layers agree on what counts as help
+_HELP_REQUESTS = frozenset({
+    "help",
+    "?",
+    "/help",
+    "what can you do",
+    "what can you help with",
+})
+
+
+def is_help_request(request: str) -> bool:
+    """Whether a request is a bare help request that needs no parsing."""
+    return request.strip().lower() in _HELP_REQUESTS
+
+
+# Instructions for the function-calling parse; identical for every request
+_SYSTEM_MESSAGE = SystemMessage(
+    content="""You are a command parser for a staking application.
+Your task is to parse user requests into the appropriate command with parameters.
+IMPORTANT: DO NOT ask for clarification - use default values when parameters are missing.
+
+Guidelines:
+1. For stake commands, extract the amount and validator address (if provided)
+2. For unstake commands:
+   - Questions like "How do I unstake?" should use info(topic="help")
+   - Questions like "How do I unstake 5 ETH?" should use unstake(address="user", amount=5)
+3. For compound commands, ALWAYS use "user" as the default address
+4. For view commands, use "user" as default address and "position" as default view type
+5. For info commands, extract the topic
+6. For questions about whether to compound, use view command with type="compound_advice"
+7. For questions about APR values or changes, use view command with type="APR"
+   - This includes questions like "What is my current APR?"
+   - This includes questions about APR changes, like "Has my APR changed?"
+8. For questions about what to do about APR changes, use info command with topic="apr_strategy"
+   - This includes questions like "What should I do about reduced APR?"
+   - This includes any questions asking for advice about APR changes
+9. For general questions about what the agent can do, use info(topic="help")
+   - This includes questions like "help", "what can you do?", etc.
+
+Example mappings:
+- "I want to stake 5 ETH with validator 0x789" -> stake(amount=5, validator="0x789")
+- "Stake 10 ETH" -> stake(amount=10)
+- "Unstake all my ETH" -> unstake(address="user", amount="all")
+- "How do I unstake?" -> info(topic="help")
+- "What can you help me with?" -> info(topic="help")
+- "Help" -> info(topic="help")
+- "Compound my rewards" -> compound(address="user")
+- "Show my position" -> view(address="user", view_type="position")
+- "Tell me about staking risks" -> info(topic="risks")
+- "Should I compound my rewards?" -> view(address="user", view_type="compound_advice")
+- "What is the current APR?" -> view(address="user", view_type="APR")
+- "What should I do about reduced APR?" -> info(topic="apr_strategy")
+- "Help me understand APR changes" -> info(topic="apr_strategy")
+
+DEFAULTS (use these when parameters are not specified):
+- ALWAYS use "user" as the default address 
+- Use "position" as the default view type
+- Assume amounts are in ETH"""
+)
+
 class CommandParseError(Exception):
     """Raised when command parsing fails."""
     pass
@@ -94,18 +159,28 @@ class CommandParser:
     and informational queries.
     """
 
-    def __init__(self, model_name: str = "openai/gpt-4o-2024-11-20", temperature: float = 0.0):
+    def __init__(
+        self,
+        model_name: str = "openai/gpt-4o-2024-11-20",
+        temperature: float = 0.0,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize the command parser.
         
         Args:
             model_name: Name of the language model to use
             temperature: Temperature parameter for model output
+            http_client: Optional shared HTTP client for LLM calls
+            http_async_client: Optional shared async HTTP client for LLM calls
         """
         self.llm = ChatOpenAI(
             model_name=model_name,
             temperature=temperature,
             callbacks=[CommandParserLoggingHandler()],
-            base_url=os.getenv("OPENAI_BASE_URL", "https://openrouter.ai/api/v1")
+            base_url=os.getenv("OPENAI_BASE_URL", "https://openrouter.ai/api/v1"),
+            http_client=http_client,
+            http_async_client=http_async_client,
         )
         self._functions = self._get_command_functions()
         logger.info(f"Command functions: {json.dumps(self._functions, indent=2)}")
@@ -239,117 +314,116 @@ class CommandParser:
         """
         try:
             # Handle simple help requests directly
-            request_lower = request.lower().strip()
-            if request_lower in ["help", "what can you do", "what can you help with"]:
+            if is_help_request(request):
                 return InformationalCommand(topic="help")
                 
             logger.info(f"\n{'='*50}\nParsing request: {request}")
             
-            # Create system message to help with function calling
-            system_message = SystemMessage(
-                content="""You are a command parser for a staking application.
-Your task is to parse user requests into the appropriate command with parameters.
-IMPORTANT: DO NOT ask for clarification - use default values when parameters are missing.
-
-Guidelines:
-1. For stake commands, extract the amount and validator address (if provided)
-2. For unstake commands:
-   - Questions like "How do I unstake?" should use info(topic="help")
-   - Questions like "How do I unstake 5 ETH?" should use unstake(address="user", amount=5)
-3. For compound commands, ALWAYS use "user" as the default address
-4. For view commands, use "user" as default address and "position" as default view type
-5. For info commands, extract the topic
-6. For questions about whether to compound, use view command with type="compound_advice"
-7. For questions about APR values or changes, use view command with type="APR"
-   - This includes questions like "What is my current APR?"
-   - This includes questions about APR changes, like "Has my APR changed?"
-8. For questions about what to do about APR changes, use info command with topic="apr_strategy"
-   - This includes questions like "What should I do about reduced APR?"
-   - This includes any questions asking for advice about APR changes
-9. For general questions about what the agent can do, use info(topic="help")
-   - This includes questions like "help", "what can you do?", etc.
-
-Example mappings:
-- "I want to stake 5 ETH with validator 0x789" -> stake(amount=5, validator="0x789")
-- "Stake 10 ETH" -> stake(amount=10)
-- "Unstake all my ETH" -> unstake(address="user", amount="all")
-- "How do I unstake?" -> info(topic="help")
-- "What can you help me with?" -> info(topic="help")
-- "Help" -> info(topic="help")
-- "Compound my rewards" -> compound(address="user")
-- "Show my position" -> view(address="user", view_type="position")
-- "Tell me about staking risks" -> info(topic="risks")
-- "Should I compound my rewards?" -> view(address="user", view_type="compound_advice")
-- "What is the current APR?" -> view(address="user", view_type="APR")
-- "What should I do about reduced APR?" -> info(topic="apr_strategy")
-- "Help me understand APR changes" -> info(topic="apr_strategy")
-
-DEFAULTS (use these when parameters are not specified):
-- ALWAYS use "user" as the default address 
-- Use "position" as the default view type
-- Assume amounts are in ETH"""
-            )
-
-            # Call LLM to parse request
-            messages = [
-                system_message,
-                HumanMessage(content=request)
-            ]
-
             # Get response with function calling
             llm_with_tools = self.llm.bind_tools(self._functions)
-            response = llm_with_tools.invoke(messages)
+            response = llm_with_tools.invoke(self._messages_for(request))
             
             # Debug log
             logger.info(f"Response type: {type(response)}")
             logger.info(f"Response dir: {dir(response)}")
             
-            # Extract function call
-            if isinstance(response, AIMessage):
-                if not hasattr(response, 'additional_kwargs') or 'tool_calls' not in response.additional_kwargs:
-                    # If no tool calls, default to help
-                    return InformationalCommand(topic="help")
+            return self._command_from_response(response, request)
+        except Exception as e:
+            logger.error(f"Error parsing request: {str(e)}", exc_info=True)
+            # On any error, default to help
+            return InformationalCommand(topic="help")
 
-                tool_call = response.additional_kwargs['tool_calls'][0]
-                
-                # Get function name and arguments
-                func_name = tool_call['function']['name']
-                func_args = json.loads(tool_call['function']['arguments'])
+    def parse_requests(self, requests: List[str]) -> List[StakingCommand]:
+        """Parse several natural language requests with concurrent LLM calls.
+        
+        ``batch`` sends one LLM request per message, concurrently, rather than
+        a single combined call. Equivalent to calling ``parse_request`` on
+        each request; a request that fails to parse falls back to help
+        without affecting the others.
+        
+        Args:
+            requests: Natural language requests to parse
+            
+        Returns:
+            List[StakingCommand]: Parsed commands, in the order of ``requests``
+        """
+        commands: List[Optional[StakingCommand]] = [None] * len(requests)
+        pending = []
+        for i, request in enumerate(requests):
+            if is_help_request(request):
+                commands[i] = InformationalCommand(topic="help")
+            else:
+                pending.append(i)
+        if not pending:
+            return commands
 
-                # Create command based on function name
-                if func_name == "stake":
-                    return StakeCommand(
-                        address=func_args.get("address", "user"),
-                        amount=func_args["amount"],
-                        validator=func_args.get("validator")
-                    )
-                elif func_name == "unstake":
-                    return UnstakeCommand(
-                        address=func_args.get("address", "user"),
-                        amount=func_args["amount"]
-                    )
-                elif func_name == "compound":
-                    return CompoundCommand(
-                        address=func_args.get("address", "user")
-                    )
-                elif func_name == "view":
-                    cmd = ViewCommand(
-                        address=func_args.get("address", "user"),
-                        view_type=func_args.get("view_type", "position")
-                    )
-                    cmd.original_request = request
-                    return cmd
-                elif func_name == "info":
-                    return InformationalCommand(
-                        topic=func_args["topic"]
-                    )
-                else:
-                    # Unknown function, default to help
-                    return InformationalCommand(topic="help")
+        llm_with_tools = self.llm.bind_tools(self._functions)
+        responses = llm_with_tools.batch(
+            [self._messages_for(requests[i]) for i in pending],
+            return_exceptions=True,
+        )
+        for i, response in zip(pending, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                commands[i] = self._command_from_response(response, requests[i])
+            except Exception as e:
+                logger.error(f"Error parsing request: {str(e)}", exc_info=True)
+                # On any error, default to help
+                commands[i] = InformationalCommand(topic="help")
+        return commands
+
+    def _messages_for(self, request: str) -> List[BaseMessage]:
+        """Get the LLM messages for parsing a request."""
+        return [_SYSTEM_MESSAGE, HumanMessage(content=request)]
+
+    def _command_from_response(self, response, request: str) -> StakingCommand:
+        """Build the command from the LLM's function-calling response."""
+        # Extract function call
+        if isinstance(response, AIMessage):
+            if not hasattr(response, 'additional_kwargs') or 'tool_calls' not in response.additional_kwargs:
+                # If no tool calls, default to help
+                return InformationalCommand(topic="help")
+
+            tool_call = response.additional_kwargs['tool_calls'][0]
+            
+            # Get function name and arguments
+            func_name = tool_call['function']['name']
+            func_args = json.loads(tool_call['function']['arguments'])
+            address = func_args.get("address", "user")
+            if address == "user":
+                address = _DEFAULT_ADDRESS
+
+            # Create command based on function name
+            if func_name == "stake":
+                return StakeCommand(
+                    address=address,
+                    amount=func_args["amount"],
+                    validator=func_args.get("validator")
+                )
+            elif func_name == "unstake":
+                return UnstakeCommand(
+                    address=address,
+                    amount=func_args["amount"]
+                )
+            elif func_name == "compound":
+                return CompoundCommand(
+                    address=address
+                )
+            elif func_name == "view":
+                cmd = ViewCommand(
+                    address=address,
+                    view_type=func_args.get("view_type", "position")
+                )
+                cmd.original_request = request
+                return cmd
+            elif func_name == "info":
+                return InformationalCommand(
+                    topic=func_args["topic"]
+                )
             else:
-                # Unknown response type, default to help
+                # Unknown function, default to help
                 return InformationalCommand(topic="help")
-        except Exception as e:
-            logger.error(f"Error parsing request: {str(e)}", exc_info=True)
-            # On any error, default to help
+        else:
+            # Unknown response type, default to help
             return InformationalCommand(topic="help")
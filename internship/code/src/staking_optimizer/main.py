@@ -10,17 +10,21 @@ import logging
 import os
 from typing import Dict, Optional
 
-from dotenv import load_dotenv
 from langchain.agents import AgentExecutor
 from langchain_core.language_models import BaseLLM
 
-# Configure logging
+from .utils.env import load_dotenv_once
+
+# Configure logging. The level defaults to WARNING so the per-step INFO
+# dumps from the LLM callbacks stay off unless LOG_LEVEL asks for them; the
+# log file is only opened once something is actually written.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, LOG_LEVEL, logging.WARNING),
     format="%(asctime)s [%(levelname)s] %(message)s",
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler("staking_optimizer.log"),
+        logging.FileHandler("staking_optimizer.log", delay=True),
     ],
 )
 
@@ -35,7 +39,7 @@ def setup_environment() -> Dict[str, str]:
     Raises:
         ValueError: If required environment variables are missing
     """
-    load_dotenv()
+    load_dotenv_once()
     
     # Required environment variables
     required_vars = ["OPENAI_API_KEY"]  # use an openrouter key instead
@@ -4,7 +4,13 @@ This module provides core staking functionality including viewing positions,
 staking, unstaking, and reward calculations.
 """
 
-from .view import StakingPosition, get_staking_position, get_staking_position_mock, format_position
+from .view import (
+    StakingPosition,
+    get_staking_position,
+    get_staking_position_mock,
+    format_position,
+    format_position_direct,
+)
 from .stake import stake_tokens
 from .unstake import unstake_tokens
 from .rewards import calculate_rewards, claim_rewards
@@ -16,6 +22,7 @@ __all__ = [
     "get_staking_position",
     "get_staking_position_mock",
     "format_position",
+    "format_position_direct",
     "stake_tokens",
     "unstake_tokens",
     "calculate_rewards",
@@ -72,3 +72,33 @@ def format_position(position: StakingPosition) -> Dict[str, str]:
         "apr": f"{float(position.apr * 100):.1f}%",
         "previous_apr": f"{float(position.previous_apr * 100):.1f}%" if position.previous_apr else None,
     }
+
+
+def format_position_direct(
+    address: str,
+    blockchain: MockBlockchainState,
+    contract: MockStakingContract,
+) -> Dict[str, str]:
+    """Get the formatted staking position for an address in one pass.
+
+    Equivalent to ``format_position(get_staking_position_mock(...))``, but
+    reads the contract state straight into the output without building an
+    intermediate StakingPosition.
+
+    Args:
+        address: Address to get position for
+        blockchain: Mock blockchain state
+        contract: Mock staking contract
+
+    Returns:
+        Dictionary with formatted position details
+    """
+    apr = contract.get_apr()
+    previous_apr = contract.get_previous_apr()
+    return {
+        "address": address,
+        "staked": f"{float(contract.get_stake(address)):.6f} ETH",
+        "rewards": f"{float(contract.get_rewards(address)):.6f} ETH",
+        "apr": f"{float(apr * 100):.1f}%",
+        "previous_apr": f"{float(previous_apr * 100):.1f}%" if previous_apr else None,
+    }
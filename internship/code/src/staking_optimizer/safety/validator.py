@@ -21,6 +21,7 @@ class SafetyValidator:
         _max_request_length: Maximum allowed length for user requests
         _safety_score_threshold: Minimum safety score required to pass validation
         _last_error_message: Last error message from validation
+        _rules_version: Incremented whenever the patterns or keywords change
     """
 
     def __init__(self):
@@ -107,6 +108,18 @@ class SafetyValidator:
         # Track last error message
         self._last_error_message = None
 
+        # Bumped by add_blocked_pattern/add_required_keyword
+        self._rules_version = 0
+
+    @property
+    def rules_version(self) -> int:
+        """Version of the validation rules, for invalidating cached results.
+
+        Returns:
+            int: Counter that increases whenever a pattern or keyword is added
+        """
+        return self._rules_version
+
     def validate_request(self, request: str) -> Tuple[bool, str]:
         """Validate a user request for safety and relevance.
 
@@ -231,6 +244,7 @@ class SafetyValidator:
         """
         if pattern not in self._blocked_patterns:
             self._blocked_patterns.append(pattern)
+            self._rules_version += 1
 
     def add_required_keyword(self, keyword: str) -> None:
         """Add a new keyword to the required list.
@@ -240,3 +254,4 @@ class SafetyValidator:
         """
         if keyword not in self._required_keywords:
             self._required_keywords.append(keyword)
+            self._rules_version += 1
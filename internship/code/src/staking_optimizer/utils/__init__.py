@@ -1,5 +1,6 @@
 """Utilities package for staking optimizer."""
 
+from .env import load_dotenv_once
 from .transaction import format_transaction
 
-__all__ = ['format_transaction']
+__all__ = ['format_transaction', 'load_dotenv_once']
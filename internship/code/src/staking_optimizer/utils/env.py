@@ -0,0 +1,20 @@
+"""Environment loading utilities."""
+
+from threading import Lock
+
+from dotenv import load_dotenv
+
+# .env only needs reading once per process, whichever entry point gets there first
+_DOTENV_LOADED = False
+_dotenv_lock = Lock()
+
+
+def load_dotenv_once() -> None:
+    """Load the .env file into the environment, once per process."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    with _dotenv_lock:
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
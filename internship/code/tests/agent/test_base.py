@@ -177,3 +177,13 @@ async def test_process_request_error(agent):
     state = AgentState(messages=[{"content": "Test request"}], thread_id="test")
     result = await agent.invoke(state)
     assert "Error processing request" in result.output
+
+
+@pytest.mark.asyncio
+async def test_help_request_skips_parser(agent):
+    """Test that a bare help request is answered without parsing."""
+    agent.command_parser = MagicMock()
+    result = await agent.handle_request("  Help ")
+    assert result.success
+    assert result.message.startswith("I can help you with:")
+    agent.command_parser.parse_request.assert_not_called()
@@ -23,6 +23,17 @@ def test_format_response_invalid_topic(character):
         character.format_response("invalid_topic")
 
 
+def test_format_responses_batch(character):
+    """Test formatting responses for several topics."""
+    responses = character.format_responses_batch(["risks", "help"])
+    assert responses == [
+        character.format_response("risks"),
+        character.format_response("help"),
+    ]
+    with pytest.raises(ValueError, match="Unknown topics: invalid_topic"):
+        character.format_responses_batch(["help", "invalid_topic"])
+
+
 def test_format_apr_recommendation_decrease_significant(character):
     """Test APR recommendation for significant decrease."""
     response = character.format_apr_recommendation(0.03, 0.06)  # 3% vs 6%
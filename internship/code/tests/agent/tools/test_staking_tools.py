@@ -76,6 +76,17 @@ def test_stake_tokens(mock_blockchain, mock_contract):
     assert result["value"] == "1.000000 ETH"
 
 
+def test_stake_tokens_trusted_dict_args(mock_blockchain, mock_contract):
+    """Test stake tool with pre-validated dict arguments."""
+    tools = create_staking_tools(mock_blockchain, mock_contract, trusted_args=True)
+    stake_tool = next(t for t in tools if t.name == "Stake")
+
+    # Call tool
+    result = stake_tool.func({"address": "test_address", "amount": Decimal("1.0")})
+    assert result["status"] == "success"
+    assert mock_contract.stakes["test_address"] == Decimal("1.0")
+
+
 def test_unstake_tokens(mock_blockchain, mock_contract):
     """Test unstake tokens tool."""
     tools = create_staking_tools(mock_blockchain, mock_contract)
@@ -121,3 +132,21 @@ def test_claim_rewards(mock_blockchain, mock_contract):
     assert result["status"] == "success"
     assert result["value"] == "1.000000 ETH"  # Transaction value should be the claimed rewards
     assert mock_contract.rewards["test_address"] == Decimal("0")  # Rewards should be reset to 0
+
+
+@pytest.mark.parametrize(
+    "apr, expected",
+    [
+        (Decimal("0.05"), "5.00%"),
+        (Decimal("0.1234"), "12.34%"),
+        (Decimal("-0.0005"), "-0.05%"),
+        (Decimal("-0.0525"), "-5.25%"),
+    ],
+)
+def test_get_apr_formats_sign(mock_blockchain, mock_contract, apr, expected):
+    """Test that the APR tool formats negative rates correctly."""
+    tools = create_staking_tools(mock_blockchain, mock_contract)
+    apr_tool = next(t for t in tools if t.name == "GetStakingAPR")
+
+    mock_contract.apr = apr
+    assert apr_tool.func("") == expected
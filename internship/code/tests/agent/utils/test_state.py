@@ -4,6 +4,7 @@ from langchain_core.messages import AIMessage, HumanMessage
 
 from src.staking_optimizer.agent.utils.state import (
     ConversationState,
+    ConversationStore,
     get_conversation_history,
     add_human_message,
     add_ai_message,
@@ -79,3 +80,40 @@ def test_get_messages_for_llm(conversation_state):
     assert llm_messages[0].content == "Hello"
     assert llm_messages[1].content == "Hi there!"
     assert llm_messages[2].content == "How are you?"
+
+
+def test_history_window_drops_oldest_messages():
+    """Test that history keeps only the most recent messages."""
+    state = ConversationState(thread_id="test_thread", max_messages=2)
+    add_human_message(state, "first")
+    add_ai_message(state, "second")
+    add_human_message(state, "third")
+    assert [m["content"] for m in state.messages] == ["second", "third"]
+
+    # The token budget also bounds the history
+    state = ConversationState(thread_id="test_thread", max_tokens=10)
+    add_human_message(state, "a" * 24)
+    add_ai_message(state, "b" * 24)
+    assert [m["content"] for m in state.messages] == ["b" * 24]
+    assert state.token_count == 6
+
+
+def test_conversation_store():
+    """Test that the store keeps one state per thread, bounded per shard."""
+    store = ConversationStore(shards=1, shard_size=2)
+    first = store.get("a")
+    add_human_message(first, "Hello")
+    assert store.get("a") is first
+    assert store.get("a").messages == [{"role": "user", "content": "Hello"}]
+
+    # Adding a third conversation drops the least recently used one
+    store.get("b")
+    store.get("a")
+    store.get("c")
+    assert "b" not in store
+    assert "a" in store
+    assert len(store) == 2
+
+    store.discard("a")
+    assert "a" not in store
+    assert store.get("a").messages == []
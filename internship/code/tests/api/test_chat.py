@@ -4,6 +4,7 @@ This module contains tests for the chat endpoint, including input validation,
 error handling, and integration with the StakingOptimizer agent.
 """
 
+import json
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch
@@ -31,7 +32,9 @@ def client(mock_agent):
     """Create a test client with mocked agent."""
     # Override allowed hosts for testing
     app.state.testing = True
-    return TestClient(app, base_url="http://test.example.com")
+    # Entering the client runs the app lifespan, which creates the chat service
+    with TestClient(app, base_url="http://test.example.com") as client:
+        yield client
 
 def test_chat_empty_message(client):
     """Test that empty messages are rejected."""
@@ -43,7 +46,7 @@ def test_chat_empty_message(client):
     assert response.status_code == 422  # FastAPI's default validation error code
     data = response.json()
     assert "detail" in data  # FastAPI validation error format
-    assert any("empty" in str(error).lower() for error in data["detail"])
+    assert any(error["type"] == "string_too_short" for error in data["detail"])
 
 def test_chat_message_too_long(client):
     """Test that overly long messages are rejected."""
@@ -55,7 +58,7 @@ def test_chat_message_too_long(client):
     assert response.status_code == 422  # FastAPI's default validation error code
     data = response.json()
     assert "detail" in data  # FastAPI validation error format
-    assert any("too long" in str(error).lower() for error in data["detail"])
+    assert any(error["type"] == "string_too_long" for error in data["detail"])
 
 @pytest.mark.asyncio
 async def test_chat_success(client):
@@ -72,3 +75,19 @@ async def test_chat_success(client):
     data = response.json()
     assert data["success"]
     assert "message" in data
+
+def test_chat_stream(client):
+    """Test that event-stream clients get the result as server-sent events."""
+    response = client.post(
+        "/api/v1/chat",
+        json={"message": "I want to stake 1 ETH"},
+        headers={**TEST_HEADERS, "accept": "text/event-stream"}
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = response.text.strip().split("\n\n")
+    assert events[0].startswith("event: status")
+    data = json.loads(events[-1].removeprefix("data: "))
+    assert data["success"]
+    assert "message" in data
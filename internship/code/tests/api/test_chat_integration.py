@@ -29,9 +29,9 @@ def test_client(mock_blockchain, mock_contract) -> TestClient:
     chat_service = ChatService(mock_blockchain, mock_contract)
     app.dependency_overrides[ChatService] = lambda: chat_service
     
-    # Create test client
-    client = TestClient(app)
-    yield client
+    # Create test client; entering it runs the app lifespan
+    with TestClient(app) as client:
+        yield client
     
     # Clean up
     app.dependency_overrides.clear()
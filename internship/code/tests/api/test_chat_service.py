@@ -0,0 +1,53 @@
+"""Tests for ChatService message batching."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from staking_optimizer.api.services.chat import ChatService
+from staking_optimizer.blockchain import MockBlockchainState
+from tests.mocks.agent import MockStakingOptimizerAgent
+
+
+@pytest.fixture
+def chat_service():
+    """Create a chat service with a mocked agent."""
+    with patch("staking_optimizer.api.services.chat.StakingOptimizerAgent", MockStakingOptimizerAgent):
+        yield ChatService(MockBlockchainState(), batch_wait_ms=10_000)
+
+
+@pytest.mark.asyncio
+async def test_batching_resolves_messages(chat_service):
+    """Test that batched messages get their own responses."""
+    chat_service.start_batching()
+    chat_service.batch_wait = 0
+    try:
+        responses = await asyncio.gather(
+            chat_service.process_message("hello"),
+            chat_service.process_message("what can you do"),
+        )
+    finally:
+        await chat_service.stop_batching()
+    assert all(response.success for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_stop_batching_cancels_partly_collected_batch(chat_service):
+    """Test that stopping mid-collection cancels messages already dequeued."""
+    chat_service.start_batching()
+    tasks = [
+        asyncio.create_task(chat_service.process_message(message))
+        for message in ("hello", "what can you do")
+    ]
+    # Let the batcher take both messages off the queue and wait for more
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert chat_service._queue.empty()
+
+    await chat_service.stop_batching()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*tasks, return_exceptions=True), timeout=1
+    )
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 import pytest
-from src.staking_optimizer.autocompound.monitor import RewardMonitor
+from src.staking_optimizer.autocompound.monitor import CompoundEvent, RewardMonitor
 from src.staking_optimizer.autocompound.strategy import ThresholdStrategy
 from src.staking_optimizer.blockchain.mock_contract import MockStakingContract
 from src.staking_optimizer.blockchain.mock_state import MockBlockchainState
@@ -258,3 +258,37 @@ def test_compound_stats_with_history(
     assert stats["total_rewards_compounded"] == Decimal("1.0")
     assert stats["total_gas_cost"] == Decimal("1500000")  # 15 wei * 100000 gas
     assert stats["average_gas_cost"] == Decimal("1500000")  # Same as total for one compound
+
+
+def test_compound_stats_from_initial_history(
+    test_address,
+    strategy,
+    mock_blockchain,
+    mock_contract,
+):
+    """Test that history passed at construction is counted per address."""
+    history = [
+        CompoundEvent(
+            timestamp=datetime(2024, 1, day),
+            rewards=5 * 10**17,  # 0.5 ETH in wei
+            gas_price=10,
+            gas_used=100000,
+            transaction_hash=f"0x{day}",
+            address=address,
+        )
+        for day, address in [(1, test_address), (2, test_address), (3, "0x456")]
+    ]
+    monitor = RewardMonitor(
+        address=test_address,
+        strategy=strategy,
+        blockchain=mock_blockchain,
+        contract=mock_contract,
+        compound_history=history,
+    )
+    
+    stats = monitor.get_compound_stats()
+    assert stats["total_compounds"] == 2
+    assert stats["total_rewards_compounded"] == Decimal("1.0")
+    assert stats["total_gas_cost"] == Decimal("2000000")
+    assert stats["average_gas_cost"] == Decimal("1000000")
+    assert monitor.get_compound_stats("0x456")["total_compounds"] == 1
@@ -285,3 +285,33 @@ def test_claim_no_rewards(contract: MockStakingContract, blockchain: MockBlockch
 
     with pytest.raises(ValueError, match="No rewards available to claim"):
         contract.claim_rewards(staker)
+
+
+def test_position_reflects_state_changes(contract: MockStakingContract, blockchain: MockBlockchainState) -> None:
+    """Test that cached staking positions track contract state.
+
+    Tests that each lookup returns its own position, so modifying one doesn't
+    leak into later lookups, and that staking, direct reward updates and new
+    blocks are all reflected.
+
+    Args:
+        contract: Mock staking contract instance
+        blockchain: Mock blockchain state instance
+    """
+    staker = "0x123"
+    blockchain.create_account(staker, Decimal("5.0"))
+    contract.stake(staker, Decimal("1.0"))
+
+    position = contract.get_position(staker)
+    assert position.staked == Decimal("1.0")
+    assert position.rewards == Decimal("0")
+    position.rewards = Decimal("9")
+    assert contract.get_position(staker) is not position
+    assert contract.get_position(staker).rewards == Decimal("0")
+
+    contract.rewards[staker] = Decimal("0.5")
+    assert contract.get_position(staker).rewards == Decimal("0.5")
+
+    blockchain.mine_block()
+    assert contract.get_position(staker).rewards > Decimal("0.5")
+    assert contract.get_position(staker).rewards == contract.get_rewards(staker)
@@ -1,6 +1,6 @@
 """Mock StakingOptimizer agent for testing."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
 class AgentResponse(BaseModel):
@@ -51,3 +51,14 @@ class MockStakingOptimizerAgent:
                 success=True,
                 message="I can help you with staking operations. What would you like to do?"
             )
+
+    async def handle_request_batch(self, requests: List[str]) -> List[AgentResponse]:
+        """Handle several requests from the user, in order.
+        
+        Args:
+            requests: User request messages
+            
+        Returns:
+            List of AgentResponse, one per request
+        """
+        return [await self.handle_request(request) for request in requests]
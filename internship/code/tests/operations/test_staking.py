@@ -13,7 +13,11 @@ from src.staking_optimizer.blockchain.mock_state import MockBlockchainState
 from src.staking_optimizer.blockchain.mock_contract import MockStakingContract
 from src.staking_optimizer.operations.stake import stake_tokens
 from src.staking_optimizer.operations.unstake import unstake_tokens
-from src.staking_optimizer.operations.view import get_staking_position_mock, format_position
+from src.staking_optimizer.operations.view import (
+    get_staking_position_mock,
+    format_position,
+    format_position_direct,
+)
 from src.staking_optimizer.operations.claim import claim_rewards
 from src.staking_optimizer.utils import format_transaction
 
@@ -213,6 +217,7 @@ def test_rewards_calculation(blockchain: MockBlockchainState, contract: MockStak
     formatted = format_position(position)
     rewards = Decimal(formatted["rewards"].rstrip(" ETH"))
     assert rewards > 0
+    assert format_position_direct(account["address"], blockchain, contract) == formatted
 
 
 def test_claim_rewards(blockchain: MockBlockchainState, contract: MockStakingContract, account: Dict[str, str]) -> None:
@@ -141,6 +141,19 @@ def test_add_required_keyword(validator):
     assert len(validator._required_keywords) == original_count
 
 
+def test_rules_version(validator):
+    """Test that the rules version changes only when rules are added."""
+    version = validator.rules_version
+    validator.add_blocked_pattern(r"(?i)dangerous")
+    validator.add_required_keyword("invest")
+    assert validator.rules_version == version + 2
+
+    # Duplicates leave the rules unchanged
+    validator.add_blocked_pattern(r"(?i)dangerous")
+    validator.add_required_keyword("invest")
+    assert validator.rules_version == version + 2
+
+
 def test_mixed_content_validation(validator):
     """Test validation of requests with mixed content."""
     # Safe content with unsafe elements
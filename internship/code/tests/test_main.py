@@ -11,8 +11,8 @@ from src.staking_optimizer.main import create_agent, setup_environment
 
 def test_setup_environment_missing_var():
     """Test setup_environment with missing required variable."""
-    # Mock load_dotenv to do nothing and clear environment variables
-    with patch('src.staking_optimizer.main.load_dotenv', return_value=None), \
+    # Mock the .env loading to do nothing and clear environment variables
+    with patch('src.staking_optimizer.main.load_dotenv_once', return_value=None), \
          patch.dict(os.environ, {}, clear=True):
         with pytest.raises(ValueError, match="Missing required environment variables: OPENAI_API_KEY"):
             setup_environment()